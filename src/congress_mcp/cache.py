@@ -0,0 +1,40 @@
+"""In-memory response cache for Congress.gov API requests."""
+
+import time
+from collections import OrderedDict
+
+
+class ResponseCache:
+    """Least-recently-used cache of response bodies that expire after a TTL.
+
+    Shared by every CongressClient through ``Config.response_cache``. Keys are
+    the full request path and query string, so identical requests made by
+    different tool calls are answered without another round trip.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 3600.0) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: OrderedDict[str, tuple[float, bytes]] = OrderedDict()
+
+    def get(self, key: str) -> bytes | None:
+        """Return the cached body for key, or None if missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, content = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return content
+
+    def set(self, key: str, content: bytes) -> None:
+        """Cache a response body, evicting the least recently used if full."""
+        self._entries[key] = (time.monotonic() + self.ttl, content)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -1,8 +1,14 @@
 """Async HTTP client with authentication and auto-pagination for Congress.gov API."""
 
 import asyncio
+import importlib.util
+import json
 import logging
-from typing import Any
+from collections import deque
+from collections.abc import AsyncGenerator, Callable
+from contextlib import aclosing
+from typing import Any, Protocol
+from urllib.parse import urlencode
 
 import httpx
 
@@ -16,27 +22,92 @@ from .exceptions import (
     RateLimitError,
 )
 
+# HTTP/2 lets concurrent requests multiplex over one connection. The h2 package
+# comes with the httpx[http2] dependency; fall back to HTTP/1.1 if it's missing.
+_HTTP2 = importlib.util.find_spec("h2") is not None
+
+
+# Detail requests one list call fans out at once; the shared session's pool
+# must hold at least this many so enrichment doesn't queue on itself.
+DETAIL_FANOUT = 25
+
+
+# Keep-alive pool for each httpx session, so repeated and concurrent requests
+# reuse connections instead of re-handshaking TLS.
+def _http_limits(config: Config) -> httpx.Limits:
+    """Build the connection pool limits configured on config."""
+    return httpx.Limits(
+        max_connections=config.max_connections,
+        max_keepalive_connections=config.max_keepalive_connections,
+        keepalive_expiry=config.keepalive_expiry,
+    )
+
+
+def create_http_transport(config: Config) -> httpx.AsyncHTTPTransport:
+    """Create the keep-alive connection pool used by create_http_client."""
+    return httpx.AsyncHTTPTransport(limits=_http_limits(config), http2=_HTTP2)
+
+
+def create_http_client(
+    config: Config, transport: httpx.AsyncBaseTransport | None = None
+) -> httpx.AsyncClient:
+    """Create the pooled httpx session CongressClient sends requests through.
+
+    Exposed so callers can build one session, put it on ``Config.http_client``,
+    and share it across many short-lived CongressClients. ``transport`` replaces
+    the default connection pool, e.g. with a caching wrapper around
+    ``create_http_transport(config)``.
+    """
+    return httpx.AsyncClient(
+        base_url=config.base_url,
+        timeout=config.timeout,
+        headers={"Accept": "application/json"},
+        limits=_http_limits(config),
+        http2=_HTTP2,
+        transport=transport,
+    )
+
+
+class RateLimiter(Protocol):
+    """Paces outgoing requests shared by one or more clients."""
+
+    async def acquire(self) -> None:
+        """Return once another request may be sent."""
+        ...
+
 
 class CongressClient:
     """Async HTTP client for Congress.gov API.
 
-    Handles authentication, error handling, and auto-pagination.
+    Handles authentication, error handling, and auto-pagination. An optional
+    rate limiter is awaited before every HTTP attempt, including 429 retries,
+    and an optional ``json_loads`` (e.g. ``orjson.loads``) decodes response
+    bodies in place of httpx's stdlib-based ``Response.json()``.
+
+    Each client opens and closes its own httpx session unless one is injected
+    via ``http_client`` or ``config.http_client``; an injected session is left
+    open for its owner to close.
 
     Usage:
         async with CongressClient(config) as client:
             result = await client.get("/bill/118")
     """
 
-    def __init__(self, config: Config) -> None:
+    def __init__(
+        self,
+        config: Config,
+        rate_limiter: RateLimiter | None = None,
+        json_loads: Callable[[bytes], Any] | None = None,
+        http_client: httpx.AsyncClient | None = None,
+    ) -> None:
         self.config = config
+        self._rate_limiter = rate_limiter
+        self._json_loads = json_loads
+        self._shared_client = http_client if http_client is not None else config.http_client
         self._client: httpx.AsyncClient | None = None
 
     async def __aenter__(self) -> "CongressClient":
-        self._client = httpx.AsyncClient(
-            base_url=self.config.base_url,
-            timeout=self.config.timeout,
-            headers={"Accept": "application/json"},
-        )
+        self._client = self._shared_client or create_http_client(self.config)
         return self
 
     async def __aexit__(
@@ -45,7 +116,7 @@ class CongressClient:
         exc_val: BaseException | None,
         exc_tb: Any,
     ) -> None:
-        if self._client:
+        if self._client and self._client is not self._shared_client:
             await self._client.aclose()
 
     async def get(
@@ -72,20 +143,85 @@ class CongressClient:
             AuthenticationError: Invalid API key (401/403)
             CongressAPIError: Other API errors
         """
-        if self._client is None:
-            raise RuntimeError("Client not initialized. Use 'async with' context manager.")
+        params = self._build_params(params)
+        if limit is not None:
+            params["limit"] = min(limit, self.config.max_limit)
+        params["offset"] = offset
+
+        cache = self.config.response_cache
+        content: bytes | None = None
+        if cache is not None:
+            cache_key = f"{endpoint}?{urlencode(sorted(params.items()))}"
+            content = cache.get(cache_key)
+        if content is not None:
+            # Decode a fresh copy per hit, since callers may modify the result
+            data = (self._json_loads or json.loads)(content)
+        else:
+            response = await self._request("GET", endpoint, params)
+            self._raise_for_status(response, endpoint)
+
+            data = self._json_loads(response.content) if self._json_loads else response.json()
+            if cache is not None:
+                cache.set(cache_key, response.content)
+
+        # Normalize pagination metadata for LLM clients
+        pagination = data.get("pagination", {})
+        if pagination:
+            total_count = pagination.get("count", 0)
+            effective_limit = params.get("limit", self.config.default_limit)
+            data["_pagination"] = {
+                "total_count": total_count,
+                "has_more": (offset + effective_limit) < total_count,
+                "next_offset": offset + effective_limit if (offset + effective_limit) < total_count else None,
+            }
+
+        return data
+
+    async def head(self, endpoint: str, params: dict[str, Any] | None = None) -> None:
+        """Check that an endpoint resolves without downloading or decoding its body.
+
+        Issues a HEAD request, falling back to GET if the server answers 405.
 
+        Args:
+            endpoint: API endpoint path (e.g., "/bill/118")
+            params: Optional query parameters
+
+        Raises:
+            The same errors as get().
+        """
+        params = self._build_params(params)
+        response = await self._request("HEAD", endpoint, params)
+        if response.status_code == 405:
+            response = await self._request("GET", endpoint, params)
+        self._raise_for_status(response, endpoint)
+
+    def _build_params(self, params: dict[str, Any] | None) -> dict[str, Any]:
+        """Copy the caller's query parameters and add authentication."""
         params = dict(params) if params else {}
         params["api_key"] = self.config.api_key
         params["format"] = "json"
+        return params
 
-        if limit is not None:
-            params["limit"] = min(limit, self.config.max_limit)
-        params["offset"] = offset
+    async def _request(
+        self, method: str, endpoint: str, params: dict[str, Any]
+    ) -> httpx.Response:
+        """Send a request, retrying on 429 with exponential backoff.
+
+        Raises:
+            RateLimitError: Rate limit exceeded (429) after max_retries attempts
+        """
+        if self._client is None:
+            raise RuntimeError("Client not initialized. Use 'async with' context manager.")
+
+        send = self._client.head if method == "HEAD" else self._client.get
 
         for attempt in range(self.config.max_retries + 1):
-            logger.debug("GET %s (attempt %d/%d)", endpoint, attempt + 1, self.config.max_retries + 1)
-            response = await self._client.get(endpoint, params=params)
+            logger.debug(
+                "%s %s (attempt %d/%d)", method, endpoint, attempt + 1, self.config.max_retries + 1
+            )
+            if self._rate_limiter is not None:
+                await self._rate_limiter.acquire()
+            response = await send(endpoint, params=params)
 
             if response.status_code != 429:
                 break
@@ -109,6 +245,10 @@ class CongressClient:
                 logger.warning("Rate limit exceeded on %s after %d attempts", endpoint, attempt + 1)
                 raise RateLimitError()
 
+        return response
+
+    def _raise_for_status(self, response: httpx.Response, endpoint: str) -> None:
+        """Map a non-200 response to the matching exception."""
         if response.status_code == 404:
             raise NotFoundError(f"Resource not found: {endpoint}")
         if response.status_code in (401, 403):
@@ -121,21 +261,6 @@ class CongressClient:
                 status_code=response.status_code,
             )
 
-        data = response.json()
-
-        # Normalize pagination metadata for LLM clients
-        pagination = data.get("pagination", {})
-        if pagination:
-            total_count = pagination.get("count", 0)
-            effective_limit = params.get("limit", self.config.default_limit)
-            data["_pagination"] = {
-                "total_count": total_count,
-                "has_more": (offset + effective_limit) < total_count,
-                "next_offset": offset + effective_limit if (offset + effective_limit) < total_count else None,
-            }
-
-        return data
-
     async def get_all(
         self,
         endpoint: str,
@@ -144,7 +269,8 @@ class CongressClient:
     ) -> dict[str, Any]:
         """Get all results with auto-pagination.
 
-        Fetches multiple pages until all results are retrieved or max_results is reached.
+        Collects everything iter_all yields; prefer iter_all when the results
+        can be processed incrementally.
 
         Args:
             endpoint: API endpoint path
@@ -154,37 +280,102 @@ class CongressClient:
         Returns:
             Dictionary with 'results' list and 'count' of total results
         """
-        params = dict(params) if params else {}
-        all_results: list[dict[str, Any]] = []
-        offset = 0
-        batch_size = min(max_results or self.config.max_limit, self.config.max_limit)
+        all_results = [item async for item in self.iter_all(endpoint, params, max_results)]
+        return {"results": all_results, "count": len(all_results)}
 
-        while True:
-            response = await self.get(
-                endpoint,
-                params=params,
-                limit=batch_size,
-                offset=offset,
-            )
+    async def iter_all(
+        self,
+        endpoint: str,
+        params: dict[str, Any] | None = None,
+        max_results: int | None = None,
+        concurrency: int | None = None,
+    ) -> AsyncGenerator[dict[str, Any], None]:
+        """Yield all results with auto-pagination, in order, as pages arrive.
 
-            # Extract results from response (API uses various top-level keys)
-            results = self._extract_results(response)
-            all_results.extend(results)
+        Flattens iter_pages; see it for how pages are prefetched.
 
-            # Check if we have enough or reached the end
-            if max_results and len(all_results) >= max_results:
-                all_results = all_results[:max_results]
-                break
+        Args:
+            endpoint: API endpoint path
+            params: Optional query parameters
+            max_results: Maximum total results to yield (None for all)
+            concurrency: Pages to prefetch at once (default: config.max_concurrency);
+                keep it low when the caller may stop early
 
-            pagination = response.get("pagination", {})
-            total_count = pagination.get("count", 0)
+        Yields:
+            Individual result items
+        """
+        pages = self.iter_pages(endpoint, params, max_results, concurrency)
+        async with aclosing(pages):
+            async for page in pages:
+                for item in page:
+                    yield item
 
-            if offset + batch_size >= total_count or not results:
-                break
+    async def iter_pages(
+        self,
+        endpoint: str,
+        params: dict[str, Any] | None = None,
+        max_results: int | None = None,
+        concurrency: int | None = None,
+    ) -> AsyncGenerator[list[dict[str, Any]], None]:
+        """Yield each page of results with auto-pagination, in order, as it arrives.
 
-            offset += batch_size
+        Fetches the first page to learn the total count, then prefetches the
+        remaining pages concurrently (at most ``concurrency`` in flight), so
+        only that many pages are held in memory at once.
 
-        return {"results": all_results, "count": len(all_results)}
+        Args:
+            endpoint: API endpoint path
+            params: Optional query parameters
+            max_results: Maximum total results to yield (None for all)
+            concurrency: Pages to prefetch at once (default: config.max_concurrency);
+                keep it low when the caller may stop early
+
+        Yields:
+            Lists of result items, the last one truncated to max_results
+        """
+        params = dict(params) if params else {}
+        batch_size = min(max_results or self.config.max_limit, self.config.max_limit)
+
+        first_page = await self.get(endpoint, params=params, limit=batch_size, offset=0)
+        page = self._extract_results(first_page)
+
+        total_count = first_page.get("pagination", {}).get("count", 0)
+        if max_results:
+            total_count = min(total_count, max_results)
+        offsets = iter(range(batch_size, total_count, batch_size) if page else ())
+        pending: deque[asyncio.Task[dict[str, Any]]] = deque()
+
+        def fetch_next_page() -> None:
+            offset = next(offsets, None)
+            if offset is not None:
+                pending.append(
+                    asyncio.create_task(
+                        self.get(endpoint, params=params, limit=batch_size, offset=offset)
+                    )
+                )
+
+        for _ in range(concurrency or self.config.max_concurrency):
+            fetch_next_page()
+
+        remaining = max_results or None
+        try:
+            while True:
+                # Pages are awaited in offset order, so they come out in order
+                if page:
+                    yield page[:remaining]
+                if remaining is not None:
+                    remaining -= len(page)
+                    if remaining <= 0:
+                        return
+                if not pending:
+                    return
+                response = await pending.popleft()
+                fetch_next_page()
+                page = self._extract_results(response)
+        finally:
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
 
     def _extract_results(self, response: dict[str, Any]) -> list[dict[str, Any]]:
         """Extract results list from API response.
@@ -230,13 +421,13 @@ class CongressClient:
     async def fetch_details_concurrent(
         self,
         endpoints: list[str],
-        max_concurrent: int = 25,
+        max_concurrent: int = DETAIL_FANOUT,
     ) -> list[dict[str, Any] | None]:
         """Fetch multiple detail endpoints concurrently.
 
         Args:
             endpoints: List of API endpoint paths to fetch
-            max_concurrent: Maximum number of concurrent requests (default: 25)
+            max_concurrent: Maximum number of concurrent requests (default: DETAIL_FANOUT)
 
         Returns:
             List of responses (None for failed requests)
@@ -265,7 +456,7 @@ class CongressClient:
         result_key: str,
         detail_key: str,
         build_endpoint: callable,
-        max_concurrent: int = 25,
+        max_concurrent: int = DETAIL_FANOUT,
     ) -> dict[str, Any]:
         """Enrich a list response by fetching details for each item.
 
@@ -274,7 +465,7 @@ class CongressClient:
             result_key: Key containing the list items (e.g., "hearings")
             detail_key: Key in detail response containing the item data (e.g., "hearing")
             build_endpoint: Function that takes a list item and returns the detail endpoint
-            max_concurrent: Maximum concurrent detail fetches (default: 25)
+            max_concurrent: Maximum concurrent detail fetches (default: DETAIL_FANOUT)
 
         Returns:
             The list response with items enriched with detail data
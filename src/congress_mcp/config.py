@@ -1,7 +1,11 @@
 """Configuration management for Congress MCP server."""
 
 import os
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+
+import httpx
+
+from .cache import ResponseCache
 
 
 @dataclass(frozen=True)
@@ -15,6 +19,16 @@ class Config:
     timeout: float = 30.0
     max_retries: int = 3
     retry_base_delay: float = 1.0
+    max_concurrency: int = 10
+    max_connections: int = 100
+    max_keepalive_connections: int = 20
+    keepalive_expiry: float = 60.0
+    cache_ttl: float = 0.0
+    cache_size: int = 1024
+    # Optional shared session; CongressClients reuse it instead of opening their own
+    http_client: httpx.AsyncClient | None = field(default=None, compare=False, repr=False)
+    # Optional shared cache of successful GET responses
+    response_cache: ResponseCache | None = field(default=None, compare=False, repr=False)
 
     @classmethod
     def from_env(cls) -> "Config":
@@ -30,6 +44,12 @@ class Config:
             CONGRESS_TIMEOUT: Request timeout in seconds (default: 30.0)
             CONGRESS_MAX_RETRIES: Max retry attempts on 429 rate limit (default: 3)
             CONGRESS_RETRY_BASE_DELAY: Base delay in seconds for exponential backoff (default: 1.0)
+            CONGRESS_MAX_CONCURRENCY: Max pages fetched at once when auto-paginating (default: 10)
+            CONGRESS_MAX_CONNECTIONS: Max open connections in the HTTP pool (default: 100)
+            CONGRESS_MAX_KEEPALIVE_CONNECTIONS: Max idle connections kept open (default: 20)
+            CONGRESS_KEEPALIVE_EXPIRY: Seconds an idle connection is kept open (default: 60.0)
+            CONGRESS_CACHE_TTL: Seconds to cache identical GET responses; 0 disables (default: 0)
+            CONGRESS_CACHE_SIZE: Maximum number of cached responses (default: 1024)
 
         Raises:
             ValueError: If CONGRESS_API_KEY is not set.
@@ -48,5 +68,23 @@ class Config:
             max_limit=int(os.environ.get("CONGRESS_MAX_LIMIT", str(cls.max_limit))),
             timeout=float(os.environ.get("CONGRESS_TIMEOUT", str(cls.timeout))),
             max_retries=int(os.environ.get("CONGRESS_MAX_RETRIES", str(cls.max_retries))),
-            retry_base_delay=float(os.environ.get("CONGRESS_RETRY_BASE_DELAY", str(cls.retry_base_delay))),
+            retry_base_delay=float(
+                os.environ.get("CONGRESS_RETRY_BASE_DELAY", str(cls.retry_base_delay))
+            ),
+            max_concurrency=int(
+                os.environ.get("CONGRESS_MAX_CONCURRENCY", str(cls.max_concurrency))
+            ),
+            max_connections=int(
+                os.environ.get("CONGRESS_MAX_CONNECTIONS", str(cls.max_connections))
+            ),
+            max_keepalive_connections=int(
+                os.environ.get(
+                    "CONGRESS_MAX_KEEPALIVE_CONNECTIONS", str(cls.max_keepalive_connections)
+                )
+            ),
+            keepalive_expiry=float(
+                os.environ.get("CONGRESS_KEEPALIVE_EXPIRY", str(cls.keepalive_expiry))
+            ),
+            cache_ttl=float(os.environ.get("CONGRESS_CACHE_TTL", str(cls.cache_ttl))),
+            cache_size=int(os.environ.get("CONGRESS_CACHE_SIZE", str(cls.cache_size))),
         )
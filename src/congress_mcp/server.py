@@ -2,8 +2,24 @@
 
 import logging
 import sys
+from dataclasses import replace
+from typing import Any
 
+import anyio
 from fastmcp import FastMCP
+from fastmcp.tools.tool import default_serializer
+
+from congress_mcp.cache import ResponseCache
+from congress_mcp.client import create_http_client
+from congress_mcp.config import Config
+from congress_mcp.middleware import EnumValidationMiddleware
+from congress_mcp.resources import register_all_resources
+from congress_mcp.tools import register_all_tools
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
 
 # Configure logging to stderr (required for MCP servers using stdio transport)
 logging.basicConfig(
@@ -13,17 +29,38 @@ logging.basicConfig(
 )
 logger = logging.getLogger("congress-mcp")
 
-from congress_mcp.config import Config
-from congress_mcp.middleware import EnumValidationMiddleware
-from congress_mcp.resources import register_all_resources
-from congress_mcp.tools import register_all_tools
-
 # Initialize configuration from environment
 config = Config.from_env()
 
+# One pooled httpx session shared by every tool call, so calls reuse keep-alive
+# connections instead of each opening (and TLS-handshaking) its own. It lives as
+# long as the process: FastMCP re-enters the server lifespan for every client
+# session, so closing it there would break the next session
+http_client = create_http_client(config)
+config = replace(
+    config,
+    http_client=http_client,
+    response_cache=ResponseCache(config.cache_size, config.cache_ttl) if config.cache_ttl else None,
+)
+
+
+def _serialize_tool_result(data: Any) -> str:
+    """Serialize a tool's dict result to JSON text with orjson.
+
+    Results orjson rejects, such as non-str dict keys or ints beyond 64 bits,
+    go through FastMCP's default serializer instead.
+    """
+    try:
+        return orjson.dumps(data, default=str).decode()
+    except TypeError:
+        return default_serializer(data)
+
+
 # Create FastMCP server
 mcp = FastMCP(
     name="congress-mcp",
+    # orjson (when installed) encodes large result pages faster than the default
+    tool_serializer=_serialize_tool_result if orjson is not None else None,
     instructions="""
 Congress.gov MCP Server provides access to official U.S. Congress data
 including bills, laws, amendments, members, committees, hearings,
@@ -61,10 +98,18 @@ register_all_tools(mcp, config)
 register_all_resources(mcp, config)
 
 
+async def _serve() -> None:
+    """Serve until shutdown, then close the shared HTTP session."""
+    try:
+        await mcp.run_async()
+    finally:
+        await http_client.aclose()
+
+
 def main() -> None:
     """Run the MCP server."""
     logger.info("Starting Congress.gov MCP server")
-    mcp.run()
+    anyio.run(_serve)
 
 
 if __name__ == "__main__":
@@ -1,7 +1,10 @@
 """Summary tools for Congress.gov API."""
 
+import functools
+import html
 import logging
 import re
+from contextlib import aclosing
 from typing import Annotated, Any
 
 import httpx
@@ -20,22 +23,105 @@ except ImportError:
 logger = logging.getLogger(__name__)
 
 _HTML_TAG_RE = re.compile(r"<[^>]+>")
-_HTML_ENTITIES = {
-    "&amp;": "&",
-    "&lt;": "<",
-    "&gt;": ">",
-    "&quot;": '"',
-    "&#39;": "'",
-    "&nbsp;": " ",
-}
+
+
+# Query words are runs of ASCII letters and digits: summary HTML writes those
+# literally, while punctuation and accented letters may appear as entities
+_QUERY_WORD_SPLIT_RE = re.compile(r"[^0-9a-z]+")
+
+
+# Joins a page of summary texts into one buffer for the page-level prefilter
+_PAGE_SEPARATOR = "\x00"
 
 
 def _strip_html(text: str) -> str:
-    """Remove HTML tags and decode common entities from summary text."""
-    clean = _HTML_TAG_RE.sub("", text)
-    for entity, char in _HTML_ENTITIES.items():
-        clean = clean.replace(entity, char)
-    return clean
+    """Remove HTML tags and decode entities from summary text."""
+    # Non-breaking spaces, literal or decoded, become plain spaces so phrase
+    # searches match across them
+    if "<" not in text and "&" not in text:
+        return text.replace("\xa0", " ")
+    # One pass over every HTML5 entity
+    return html.unescape(_HTML_TAG_RE.sub("", text)).replace("\xa0", " ")
+
+
+# Summary text repeats across paginated re-fetches and repeated searches.
+# Searches only strip prefilter survivors, so entries are few but reused often
+@functools.lru_cache(maxsize=8192)
+def _search_text(text: str) -> str:
+    """Strip a summary's HTML, then lowercase it for case-insensitive matching.
+
+    Entity names are case-sensitive, so the original text is stripped before
+    it is lowercased.
+    """
+    return _strip_html(text).lower()
+
+
+@functools.lru_cache(maxsize=64)
+def _compile_terms(
+    terms: tuple[str, ...],
+) -> tuple[tuple[tuple[str, ...], ...], re.Pattern[str] | None]:
+    """Split lowercased search terms into prefilter words and build a matcher.
+
+    Every word of a term must appear in the raw HTML for the phrase to appear
+    in its plain text, so checking the words first skips stripping the many
+    summaries that cannot match. Several terms are matched in one pass with a
+    single alternation; a lone term needs no regex.
+    """
+    term_words = tuple(
+        tuple(word for word in _QUERY_WORD_SPLIT_RE.split(term) if word) for term in terms
+    )
+    terms_re = re.compile("|".join(map(re.escape, terms))) if len(terms) > 1 else None
+    return term_words, terms_re
+
+
+def _has_term_words(text_lower: str, term_words: tuple[tuple[str, ...], ...]) -> bool:
+    """Check whether every word of at least one term appears in text_lower."""
+    return any(all(word in text_lower for word in words) for words in term_words)
+
+
+def _scan_page(
+    page: list[dict[str, Any]], terms: tuple[str, ...], max_matches: int
+) -> tuple[list[dict[str, Any]], int]:
+    """Find the summaries in one page whose plain text contains any of terms.
+
+    Args:
+        page: Summary records as returned by the API
+        terms: Lowercased keywords or phrases
+        max_matches: Stop scanning once this many summaries match
+
+    Returns:
+        The matching summaries and the number of summaries searched
+    """
+    term_words, terms_re = _compile_terms(terms)
+
+    # Lowercase the whole page in one buffer: a page with no possible match is
+    # skipped with a single scan, and the rest are split back into per-summary
+    # lowercased texts
+    texts = [summary.get("text", "") for summary in page]
+    page_lower = _PAGE_SEPARATOR.join(texts).lower()
+    if not _has_term_words(page_lower, term_words):
+        return [], len(page)
+    texts_lower = page_lower.split(_PAGE_SEPARATOR)
+    if len(texts_lower) != len(page):
+        texts_lower = [text.lower() for text in texts]
+
+    matches: list[dict[str, Any]] = []
+    rows = zip(page, texts, texts_lower)
+    for searched, (summary, text, text_lower) in enumerate(rows, start=1):
+        if not _has_term_words(text_lower, term_words):
+            continue
+        # The lowercased raw text only serves the cheap reject step; survivors
+        # are matched against their cached plain text
+        plain_text = _search_text(text)
+        if terms_re is None:
+            found = terms[0] in plain_text
+        else:
+            found = terms_re.search(plain_text) is not None
+        if found:
+            matches.append(summary)
+            if len(matches) >= max_matches:
+                return matches, searched
+    return matches, len(page)
 
 
 def register_summary_tools(mcp: "FastMCP", config: Config) -> None:
@@ -167,6 +253,13 @@ def register_summary_tools(mcp: "FastMCP", config: Config) -> None:
                 min_length=2,
             ),
         ],
+        queries: Annotated[
+            list[Annotated[str, Field(min_length=2)]] | None,
+            Field(
+                description="Optional additional keywords or phrases; a summary matches "
+                "if it contains the query or any of these"
+            ),
+        ] = None,
         bill_type: Annotated[
             BillTypeLiteral | None,
             Field(
@@ -192,6 +285,9 @@ def register_summary_tools(mcp: "FastMCP", config: Config) -> None:
 
         The search is case-insensitive and matches against the plain text
         content of each summary (HTML tags are stripped before matching).
+        Pass queries to match any of several keywords in one search.
+        Summaries are searched most recently updated first, and fetching
+        stops as soon as max_matches is reached.
 
         Tip: Provide bill_type to narrow results and speed up the search.
         For past Congresses, from_date/to_date are required for the API
@@ -203,54 +299,34 @@ def register_summary_tools(mcp: "FastMCP", config: Config) -> None:
             else:
                 endpoint = f"/summaries/{congress}"
 
-            params: dict[str, Any] = {}
+            # Most recently updated first, so early matches are the most relevant
+            params: dict[str, Any] = {"sort": "updateDate+desc"}
             if from_date:
                 params["fromDateTime"] = f"{from_date}T00:00:00Z"
             if to_date:
                 params["toDateTime"] = f"{to_date}T23:59:59Z"
 
-            query_lower = query.lower()
+            terms = (query.lower(), *(term.lower() for term in queries or ()))
             matches: list[dict[str, Any]] = []
             total_searched = 0
-            offset = 0
-            batch_size = config.max_limit
-
             search_complete = True
 
-            while True:
-                try:
-                    response = await client.get(
-                        endpoint,
-                        params=params,
-                        limit=batch_size,
-                        offset=offset,
-                    )
-                except httpx.HTTPError as exc:
-                    logger.warning("HTTP error during search pagination: %s", exc)
-                    search_complete = False
-                    break
-
-                summaries = response.get("summaries", [])
-                total_searched += len(summaries)
-
-                for summary in summaries:
-                    text = summary.get("text", "")
-                    plain_text = _strip_html(text)
-                    if query_lower in plain_text.lower():
-                        matches.append(summary)
+            # Stream summaries page by page, reading one page ahead; closing the
+            # stream once max_matches is reached cancels the read-ahead
+            pages = client.iter_pages(endpoint, params=params, concurrency=1)
+            try:
+                async with aclosing(pages):
+                    async for page in pages:
+                        page_matches, searched = _scan_page(
+                            page, terms, max_matches - len(matches)
+                        )
+                        matches.extend(page_matches)
+                        total_searched += searched
                         if len(matches) >= max_matches:
                             break
-
-                if len(matches) >= max_matches:
-                    break
-
-                pagination = response.get("pagination", {})
-                total_count = pagination.get("count", 0)
-
-                if offset + batch_size >= total_count or not summaries:
-                    break
-
-                offset += batch_size
+            except httpx.HTTPError as exc:
+                logger.warning("HTTP error during search pagination: %s", exc)
+                search_complete = False
 
             return {
                 "matches": matches,
@@ -258,4 +334,5 @@ def register_summary_tools(mcp: "FastMCP", config: Config) -> None:
                 "total_summaries_searched": total_searched,
                 "search_complete": search_complete,
                 "query": query,
+                **({"queries": queries} if queries else {}),
             }
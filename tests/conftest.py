@@ -1,12 +1,153 @@
 """Pytest fixtures for Congress MCP tests."""
 
+import asyncio
+import functools
+import os
+import re
+import sys
+from collections.abc import AsyncIterator
+from dataclasses import replace
+from pathlib import Path
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock
 
+import httpx
 import pytest
+import pytest_asyncio
+from fastmcp import FastMCP
+from fastmcp.client import Client
 
+from congress_mcp.client import create_http_client, create_http_transport
 from congress_mcp.config import Config
 
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+# Requests each pytest-xdist worker may have in flight at once; workers share
+# one API key's rate limit
+XDIST_WORKER_MAX_IN_FLIGHT = 5
+
+# One KEY=value assignment per line; comment lines never match
+_ENV_LINE = re.compile(r"^[ \t]*([A-Za-z_][A-Za-z0-9_]*)[ \t]*=[ \t]*(.*?)[ \t]*$", re.M)
+
+
+@functools.cache
+def load_env_file(path: Path = Path(__file__).parent.parent / ".env") -> dict[str, str]:
+    """Parse a .env file into a dict, reading it at most once per session."""
+    if not path.exists():
+        return {}
+    return dict(_ENV_LINE.findall(path.read_text()))
+
+
+# Load .env before test modules evaluate their CONGRESS_API_KEY skip conditions
+for _key, _value in load_env_file().items():
+    os.environ.setdefault(_key, _value)
+
+
+def pytest_collection_modifyitems(items: list[pytest.Item]) -> None:
+    """Mark every test that talks to the live API, so ``-m "not live"`` skips them."""
+    for item in items:
+        if "live_config" in getattr(item, "fixturenames", ()):
+            item.add_marker(pytest.mark.live)
+
+
+if uvloop is not None and sys.platform != "win32":
+
+    def pytest_asyncio_loop_factories(config: pytest.Config, item: pytest.Item) -> dict[str, Any]:
+        """Run async tests and fixtures on uvloop when it is installed."""
+        return {"uvloop": uvloop.new_event_loop}
+
+
+class ThrottledTransport(httpx.AsyncBaseTransport):
+    """Cap the number of requests in flight through the wrapped transport."""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, max_in_flight: int) -> None:
+        self._transport = transport
+        self._semaphore = asyncio.Semaphore(max_in_flight)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        async with self._semaphore:
+            return await self._transport.handle_async_request(request)
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+class CachingTransport(httpx.AsyncBaseTransport):
+    """Serve repeated identical GET requests from memory.
+
+    Many live tests issue the same request (same endpoint, congress, chamber
+    and date window); only the first one of each goes over the network. Only
+    successful responses are cached, and only for the current test session.
+    """
+
+    def __init__(self, transport: httpx.AsyncBaseTransport) -> None:
+        self._transport = transport
+        self._responses: dict[str, tuple[int, httpx.Headers, bytes]] = {}
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        if request.method != "GET":
+            return await self._transport.handle_async_request(request)
+
+        key = str(request.url)
+        cached = self._responses.get(key)
+        if cached is None:
+            response = await self._transport.handle_async_request(request)
+            if response.status_code != 200:
+                return response
+            # Read the still-encoded body off the transport stream; the client
+            # decodes each copy as usual
+            stream = response.stream
+            assert isinstance(stream, httpx.AsyncByteStream)
+            try:
+                content = b"".join([chunk async for chunk in stream])
+            finally:
+                await response.aclose()
+            cached = self._responses[key] = (response.status_code, response.headers, content)
+
+        status_code, headers, content = cached
+        return httpx.Response(status_code, headers=headers, content=content, request=request)
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+@pytest_asyncio.fixture(scope="session")
+async def live_config() -> AsyncIterator[Config]:
+    """Live-API configuration whose clients all share one pooled httpx session.
+
+    Reusing the session keeps connections alive across tests instead of paying
+    a TCP + TLS handshake per tool call, and its CachingTransport answers
+    repeated identical requests without another round trip. Under pytest-xdist
+    each worker process gets its own session, throttled to
+    XDIST_WORKER_MAX_IN_FLIGHT concurrent requests.
+    """
+    config = Config.from_env()
+    transport: httpx.AsyncBaseTransport = create_http_transport(config)
+    if os.environ.get("PYTEST_XDIST_WORKER"):
+        transport = ThrottledTransport(transport, XDIST_WORKER_MAX_IN_FLIGHT)
+    transport = CachingTransport(transport)
+    async with create_http_client(config, transport=transport) as http_client:
+        yield replace(config, http_client=http_client)
+
+
+@pytest_asyncio.fixture(scope="module")
+async def client(request: pytest.FixtureRequest, live_config: Config) -> AsyncIterator[Client]:
+    """FastMCP Client for the tools the test module lists in TOOL_REGISTRARS.
+
+    Module-scoped, so one server and one client session serve every test in
+    the module. Usage (at a test module's top level):
+        TOOL_REGISTRARS = (register_bill_tools,)
+    """
+    name = request.module.__name__.rpartition(".")[2].replace("_", "-")
+    mcp = FastMCP(name=name)
+    for register in request.module.TOOL_REGISTRARS:
+        register(mcp, live_config)
+    async with Client(transport=mcp) as c:
+        yield c
+
 
 @pytest.fixture
 def mock_config() -> Config:
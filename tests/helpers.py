@@ -0,0 +1,20 @@
+"""Shared helpers for Congress MCP tests."""
+
+import json
+from collections.abc import Callable
+from typing import Any
+
+# orjson is optional: decode with it when installed, else the stdlib json
+json_loads: Callable[[str | bytes], Any]
+try:
+    import orjson
+except ImportError:
+    json_loads = json.loads
+else:
+    json_loads = orjson.loads
+
+
+def parse_result(result: Any) -> Any:
+    """Parse CallToolResult.data — handles str, bytes and already-decoded data."""
+    data = result.data
+    return json_loads(data) if isinstance(data, (str, bytes)) else data
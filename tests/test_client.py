@@ -1,12 +1,15 @@
 """Tests for HTTP client functionality."""
 
 import logging
+from dataclasses import replace
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import httpx
 import pytest
 
+from congress_mcp import client as client_module
+from congress_mcp.cache import ResponseCache
 from congress_mcp.client import CongressClient
 from congress_mcp.config import Config
 from congress_mcp.exceptions import (
@@ -206,6 +209,141 @@ class TestCongressClient:
 
             mock_client.aclose.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_client_reuses_session_across_requests(self, config: Config) -> None:
+        """One pooled httpx session serves every request within the context manager."""
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {}
+
+        with patch("httpx.AsyncClient") as mock_client_class:
+            mock_client = AsyncMock()
+            mock_client.get = AsyncMock(return_value=mock_response)
+            mock_client.aclose = AsyncMock()
+            mock_client_class.return_value = mock_client
+
+            async with CongressClient(config) as client:
+                await client.get("/bill/118")
+                await client.get("/member")
+
+            mock_client_class.assert_called_once()
+            limits = mock_client_class.call_args.kwargs["limits"]
+            assert limits.max_connections == config.max_connections
+            assert limits.max_keepalive_connections == config.max_keepalive_connections
+            assert limits.keepalive_expiry == config.keepalive_expiry
+            assert mock_client_class.call_args.kwargs["http2"] is client_module._HTTP2
+            assert mock_client.get.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_client_reuses_injected_session_without_closing(self, config: Config) -> None:
+        """A session on config.http_client is used as-is and left open on exit."""
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {}
+        shared = AsyncMock()
+        shared.get = AsyncMock(return_value=mock_response)
+        shared.aclose = AsyncMock()
+
+        with patch("httpx.AsyncClient") as mock_client_class:
+            shared_config = replace(config, http_client=shared)
+            for _ in range(2):
+                async with CongressClient(shared_config) as client:
+                    await client.get("/bill/118")
+
+            mock_client_class.assert_not_called()
+            assert shared.get.call_count == 2
+            shared.aclose.assert_not_called()
+
+    @pytest.mark.asyncio
+    @patch("congress_mcp.client.asyncio.sleep", new_callable=AsyncMock)
+    async def test_client_acquires_rate_limiter_per_attempt(
+        self, mock_sleep: AsyncMock, config: Config
+    ) -> None:
+        """The rate limiter is awaited before every attempt, including 429 retries."""
+        limited = MagicMock()
+        limited.status_code = 429
+        limited.headers = {}
+        ok = MagicMock()
+        ok.status_code = 200
+        ok.json.return_value = {}
+        rate_limiter = MagicMock()
+        rate_limiter.acquire = AsyncMock()
+
+        with patch("httpx.AsyncClient") as mock_client_class:
+            mock_client = AsyncMock()
+            mock_client.get = AsyncMock(side_effect=[limited, ok])
+            mock_client.aclose = AsyncMock()
+            mock_client_class.return_value = mock_client
+
+            async with CongressClient(config, rate_limiter=rate_limiter) as client:
+                await client.get("/bill/118")
+
+            assert rate_limiter.acquire.await_count == 2
+            assert mock_client.get.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_client_uses_custom_json_loads(self, config: Config) -> None:
+        """A json_loads callable decodes the raw body instead of Response.json()."""
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.content = b'{"bills": []}'
+        json_loads = MagicMock(return_value={"bills": []})
+
+        with patch("httpx.AsyncClient") as mock_client_class:
+            mock_client = AsyncMock()
+            mock_client.get = AsyncMock(return_value=mock_response)
+            mock_client.aclose = AsyncMock()
+            mock_client_class.return_value = mock_client
+
+            async with CongressClient(config, json_loads=json_loads) as client:
+                result = await client.get("/bill/118")
+
+            assert result == {"bills": []}
+            json_loads.assert_called_once_with(b'{"bills": []}')
+            mock_response.json.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_head_raises_not_found_without_get(self, config: Config) -> None:
+        """head() maps a 404 HEAD response to NotFoundError without issuing a GET."""
+        mock_response = MagicMock()
+        mock_response.status_code = 404
+
+        with patch("httpx.AsyncClient") as mock_client_class:
+            mock_client = AsyncMock()
+            mock_client.head = AsyncMock(return_value=mock_response)
+            mock_client.get = AsyncMock()
+            mock_client.aclose = AsyncMock()
+            mock_client_class.return_value = mock_client
+
+            async with CongressClient(config) as client:
+                with pytest.raises(NotFoundError):
+                    await client.head("/bill/999/hr/99999")
+
+            assert mock_client.head.call_args.kwargs["params"]["api_key"] == "test_key"
+            mock_client.get.assert_not_called()
+            mock_response.json.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_head_falls_back_to_get_on_405(self, config: Config) -> None:
+        """head() retries with GET when the server does not allow HEAD."""
+        not_allowed = MagicMock()
+        not_allowed.status_code = 405
+        ok = MagicMock()
+        ok.status_code = 200
+
+        with patch("httpx.AsyncClient") as mock_client_class:
+            mock_client = AsyncMock()
+            mock_client.head = AsyncMock(return_value=not_allowed)
+            mock_client.get = AsyncMock(return_value=ok)
+            mock_client.aclose = AsyncMock()
+            mock_client_class.return_value = mock_client
+
+            async with CongressClient(config) as client:
+                await client.head("/bill/118")
+
+            mock_client.get.assert_called_once()
+            ok.json.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_client_not_initialized_error(self, config: Config) -> None:
         """Raises error when used without context manager."""
@@ -408,6 +546,11 @@ class TestConcurrentDetailFetching:
         # No warnings
         assert "_warnings" not in result
 
+    def test_default_pool_holds_detail_fanout(self) -> None:
+        """One list call's detail fan-out fits in the shared session's pool."""
+        config = Config(api_key="test_key")
+        assert config.max_connections >= client_module.DETAIL_FANOUT
+
 
 class TestRetryBackoff:
     """Tests for 429 retry with exponential backoff."""
@@ -513,3 +656,68 @@ class TestRetryBackoff:
 
             assert mock_client.get.call_count == 1
             mock_sleep.assert_not_called()
+
+
+class TestResponseCache:
+    """Tests for the shared response cache."""
+
+    @pytest.mark.asyncio
+    async def test_client_serves_repeat_get_from_cache(self, config: Config) -> None:
+        """An identical GET is answered from config.response_cache without a request."""
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.content = b'{"bills": [{"number": 1}]}'
+        mock_response.json.side_effect = lambda: {"bills": [{"number": 1}]}
+        cached_config = replace(config, response_cache=ResponseCache())
+
+        with patch("httpx.AsyncClient") as mock_client_class:
+            mock_client = AsyncMock()
+            mock_client.get = AsyncMock(return_value=mock_response)
+            mock_client.aclose = AsyncMock()
+            mock_client_class.return_value = mock_client
+
+            async with CongressClient(cached_config) as client:
+                first = await client.get("/bill/118")
+                first["bills"].clear()
+                second = await client.get("/bill/118")
+                await client.get("/bill/118", offset=20)
+
+            # Hits decode a fresh copy, unaffected by changes to earlier results
+            assert second["bills"] == [{"number": 1}]
+            assert mock_client.get.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_client_does_not_cache_errors(self, config: Config) -> None:
+        """Failed responses are not cached."""
+        mock_response = MagicMock()
+        mock_response.status_code = 404
+        cached_config = replace(config, response_cache=ResponseCache())
+
+        with patch("httpx.AsyncClient") as mock_client_class:
+            mock_client = AsyncMock()
+            mock_client.get = AsyncMock(return_value=mock_response)
+            mock_client.aclose = AsyncMock()
+            mock_client_class.return_value = mock_client
+
+            async with CongressClient(cached_config) as client:
+                for _ in range(2):
+                    with pytest.raises(NotFoundError):
+                        await client.get("/bill/118/hr/99999")
+
+            assert mock_client.get.call_count == 2
+            assert len(cached_config.response_cache) == 0
+
+    def test_cache_expires_and_evicts_least_recently_used(self) -> None:
+        """Entries expire after the TTL, and the oldest is evicted when full."""
+        expired = ResponseCache(ttl=0)
+        expired.set("a", b"1")
+        assert expired.get("a") is None
+
+        cache = ResponseCache(maxsize=2)
+        cache.set("a", b"1")
+        cache.set("b", b"2")
+        cache.get("a")
+        cache.set("c", b"3")
+        assert cache.get("a") == b"1"
+        assert cache.get("b") is None
+        assert cache.get("c") == b"3"
@@ -0,0 +1,12 @@
+"""Tests for the event loop the async test suite runs on."""
+
+import asyncio
+
+import pytest
+
+uvloop = pytest.importorskip("uvloop")
+
+
+async def test_runs_on_uvloop_when_installed() -> None:
+    """conftest's loop factory hook puts async tests on uvloop."""
+    assert isinstance(asyncio.get_running_loop(), uvloop.Loop)
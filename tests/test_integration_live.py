@@ -5,43 +5,72 @@ Produces a markdown report at .context/integration-test-report.md
 
 Usage:
     CONGRESS_API_KEY=your_key python tests/test_integration_live.py
+
+Runs on uvloop and decodes with orjson when they are installed.
 """
 
 import asyncio
+import io
+import operator
 import os
+import random
+import re
+import string
 import sys
 import time
 import traceback
-from dataclasses import dataclass, field
+from collections.abc import Awaitable, Callable, Coroutine, Hashable
+from dataclasses import dataclass, field, replace
 from datetime import datetime, timezone
+from enum import IntEnum
 from pathlib import Path
 from typing import Any
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
-# Load .env file if present
+# Load .env file if present (KEY=value lines; comments and blanks never match)
+_ENV_RE = re.compile(r"^[ \t]*([A-Za-z_][A-Za-z0-9_]*)[ \t]*=[ \t]*(.*?)[ \t\r]*$", re.MULTILINE)
 _env_path = Path(__file__).parent.parent / ".env"
 if _env_path.exists():
-    for line in _env_path.read_text().splitlines():
-        line = line.strip()
-        if line and not line.startswith("#") and "=" in line:
-            key, _, value = line.partition("=")
-            os.environ.setdefault(key.strip(), value.strip())
+    for key, value in _ENV_RE.findall(_env_path.read_text()):
+        os.environ.setdefault(key, value)
 
 from congress_mcp.client import CongressClient
 from congress_mcp.config import Config
 from congress_mcp.exceptions import CongressAPIError, NotFoundError, RateLimitError
 
+# orjson is optional: decode responses with it when installed, else httpx's json
+json_loads: Callable[[bytes], Any] | None
+try:
+    import orjson
+except ImportError:
+    json_loads = None
+else:
+    json_loads = orjson.loads
+
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 
 CONGRESS = 118
 LIMIT = 3
-DELAY = 0.5  # seconds between API calls
+CONCURRENCY = 8  # max in-flight API calls
 MAX_RETRIES = 3
-RETRY_BASE_DELAY = 10  # seconds to wait on rate limit before retry
+RETRY_BASE_DELAY = 2.0  # seconds; doubled per attempt, with jitter
+TRACEBACK_LIMIT = 10  # stack frames kept in FAIL tracebacks
+
+# Adaptive pacing (AIMD): halve the request rate on a 429, and add a little
+# back after a run of successes, never exceeding MAX_RATE_PER_SEC. 429s within
+# DECREASE_COOLDOWN of a decrease belong to the same rate-limit window and
+# only count once.
+RATE_PER_SEC = 5.0
+MIN_RATE_PER_SEC = 0.25
+MAX_RATE_PER_SEC = 8.0
+RATE_INCREASE = 0.25
+RECOVERY_SUCCESSES = 20
+BURST = 10
+DECREASE_COOLDOWN = 2.0  # seconds
 
 # Known-good fallback IDs for 118th Congress
 FALLBACKS: dict[str, Any] = {
@@ -71,46 +100,237 @@ FALLBACKS: dict[str, Any] = {
     "requirement_number": 1,
 }
 
+# (key, value) pairs of FALLBACKS, for O(1) "was this ID a fallback?" checks
+FALLBACK_ITEMS = frozenset(
+    (key, value) for key, value in FALLBACKS.items() if isinstance(value, Hashable)
+)
+
 
 # ---------------------------------------------------------------------------
 # Result tracking
 # ---------------------------------------------------------------------------
 
-@dataclass
+class Status(IntEnum):
+    PASS = 0
+    FAIL = 1
+    WARN = 2
+    SKIP = 3
+
+
+# Report labels, indexed by Status
+STATUS_ICONS = ("PASS", "**FAIL**", "WARN", "SKIP")
+
+
+@dataclass(slots=True, frozen=True)
 class TestResult:
     tool_name: str
     category: str
-    status: str = "SKIP"  # PASS, FAIL, WARN, SKIP
-    elapsed_ms: float = 0.0
+    status: Status = Status.SKIP
+    elapsed_ns: int = 0
+    retries: int = 0
+    waited_ns: int = 0
+    paced_ns: int = 0
     notes: str = ""
     error_trace: str = ""
 
+    @property
+    def elapsed_ms(self) -> int:
+        """Elapsed time of the final attempt, rounded to whole milliseconds."""
+        return ns_to_ms(self.elapsed_ns)
+
+    @property
+    def paced_ms(self) -> int:
+        """Time spent waiting for a token and an in_flight slot, in milliseconds."""
+        return ns_to_ms(self.paced_ns)
+
+
+def ns_to_ms(ns: int) -> int:
+    """Round a nanosecond duration to whole milliseconds."""
+    return (ns + 500_000) // 1_000_000
+
+
+def retry_note(retries: int, waited_ns: int) -> str:
+    """Retry count and time spent on earlier attempts, or "" if never retried."""
+    if not retries:
+        return ""
+    plural = "retry" if retries == 1 else "retries"
+    return f" ({retries} {plural}, {waited_ns / 1e9:.1f}s waited)"
+
+
+# ---------------------------------------------------------------------------
+# Rate limiting
+# ---------------------------------------------------------------------------
 
-results: list[TestResult] = []
+class AdaptiveTokenBucket:
+    """Token bucket whose refill rate adapts to observed rate limiting.
+
+    run_test awaits a token before every attempt, outside the timed window, so
+    pacing never counts toward a call's elapsed time. A 429 halves the refill rate, at most
+    once per DECREASE_COOLDOWN; RECOVERY_SUCCESSES consecutive successes raise
+    it by RATE_INCREASE, up to MAX_RATE_PER_SEC.
+    """
+
+    def __init__(
+        self,
+        rate: float = RATE_PER_SEC,
+        burst: int = BURST,
+        min_rate: float = MIN_RATE_PER_SEC,
+        max_rate: float = MAX_RATE_PER_SEC,
+    ) -> None:
+        self.rate = rate
+        self.burst = burst
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._successes = 0
+        self._last_decrease = float("-inf")
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> float:
+        """Credit tokens earned at the current rate since the last refill."""
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+        return now
+
+    async def acquire(self) -> None:
+        """Wait until a token is available, then consume it."""
+        async with self._lock:
+            while True:
+                self._refill()
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+    def on_success(self) -> None:
+        """Additive increase after a run of successful calls."""
+        self._successes += 1
+        if self._successes >= RECOVERY_SUCCESSES:
+            self._successes = 0
+            self._refill()
+            self.rate = min(self.max_rate, self.rate + RATE_INCREASE)
+
+    def on_rate_limited(self) -> None:
+        """Multiplicative decrease after a 429, once per rate-limit window.
+
+        Concurrent calls sent before the decrease come back as a burst of 429s;
+        only the first of them halves the rate. Tokens already earned are kept,
+        since waiters have accounted for them.
+        """
+        self._successes = 0
+        now = self._refill()
+        if now - self._last_decrease < DECREASE_COOLDOWN:
+            return
+        self._last_decrease = now
+        self.rate = max(self.min_rate, self.rate / 2)
+
+
+bucket = AdaptiveTokenBucket()
+
+# Held only while a request is on the wire, never while waiting for a token or
+# during retry backoff, so a paced or rate-limited call does not stall its
+# siblings.
+in_flight = asyncio.Semaphore(CONCURRENCY)
 
 
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
 
-def extract(response: dict[str, Any] | None, keys: list[str], fallback: Any) -> Any:
+_compiled_paths: dict[tuple[str | int, ...], Callable[[Any], Any]] = {}
+
+
+def compile_path(*keys: str | int) -> Callable[[Any], Any]:
+    """Compile a nested lookup path (e.g. ``"bills", 0, "type"``) into a getter.
+
+    Getters are cached by path, so each path is built once per process.
+    """
+    if keys in _compiled_paths:
+        return _compiled_paths[keys]
+
+    steps = tuple(operator.itemgetter(key) for key in keys)
+
+    def get(obj: Any) -> Any:
+        for step in steps:
+            obj = step(obj)
+        return obj
+
+    _compiled_paths[keys] = get
+    return get
+
+
+def extract(response: dict[str, Any] | None, path: Callable[[Any], Any], fallback: Any) -> Any:
     """Safely extract a nested value from an API response, falling back on failure."""
     if response is None:
         return fallback
     try:
-        obj: Any = response
-        for key in keys:
-            if isinstance(obj, list):
-                obj = obj[int(key)]
-            else:
-                obj = obj[key]
-        return obj if obj is not None else fallback
-    except (KeyError, IndexError, TypeError, ValueError):
+        value = path(response)
+    except (KeyError, IndexError, TypeError):
         return fallback
+    return value if value is not None else fallback
+
+
+# First-item ID paths used to seed Phase 2 from Phase 1 list responses
+FIRST_BILL_TYPE = compile_path("bills", 0, "type")
+FIRST_BILL_NUMBER = compile_path("bills", 0, "number")
+FIRST_AMENDMENT_TYPE = compile_path("amendments", 0, "type")
+FIRST_AMENDMENT_NUMBER = compile_path("amendments", 0, "number")
+FIRST_BIOGUIDE_ID = compile_path("members", 0, "bioguideId")
+FIRST_COMMITTEE_CODE = compile_path("committees", 0, "systemCode")
+FIRST_REPORT_NUMBER = compile_path("committeeReports", 0, "number")
+FIRST_PRINT_JACKET_NUMBER = compile_path("committeePrints", 0, "jacketNumber")
+FIRST_MEETING_EVENT_ID = compile_path("committeeMeetings", 0, "eventId")
+FIRST_HEARING_JACKET_NUMBER = compile_path("hearings", 0, "jacketNumber")
+FIRST_NOMINATION_NUMBER = compile_path("nominations", 0, "number")
+FIRST_TREATY_NUMBER = compile_path("treaties", 0, "number")
+FIRST_VOLUME_NUMBER = compile_path("dailyCongressionalRecord", 0, "volumeNumber")
+FIRST_HOUSE_COMM_NUMBER = compile_path("houseCommunications", 0, "number")
+FIRST_SENATE_COMM_NUMBER = compile_path("senateCommunications", 0, "number")
+FIRST_ROLL_CALL_NUMBER = compile_path("houseVotes", 0, "rollCallNumber")
+FIRST_CRS_REPORT_NUMBER = compile_path("CRSReports", 0, "reportNumber")
+FIRST_REQUIREMENT_NUMBER = compile_path("houseRequirements", 0, "number")
+
+
+class SeedIds:
+    """IDs from Phase 1 list calls, published per resource as each call lands.
+
+    Phase 2 awaits only the IDs its endpoint needs, so a detail call starts as
+    soon as its own list call finishes rather than after all of Phase 1.
+    """
+
+    def __init__(self) -> None:
+        self.values: dict[str, Any] = {}
+        self._futures: dict[str, asyncio.Future[Any]] = {}
+
+    def _future(self, key: str) -> asyncio.Future[Any]:
+        if key not in self._futures:
+            self._futures[key] = asyncio.get_running_loop().create_future()
+        return self._futures[key]
+
+    def publish(self, key: str, value: Any) -> None:
+        """Record an ID and wake every call waiting on it."""
+        # Type codes go into URLs as lowercase strings
+        if key.endswith("_type"):
+            value = value.lower() if isinstance(value, str) else FALLBACKS[key]
+        self.values[key] = value
+        self._future(key).set_result(value)
+
+    async def get(self, key: str) -> Any:
+        """Wait for an ID to be published."""
+        return await self._future(key)
+
+    def close(self) -> None:
+        """Resolve any ID no list call published with its fallback."""
+        for key, future in self._futures.items():
+            if not future.done():
+                future.set_result(FALLBACKS[key])
 
 
 async def run_test(
     client: CongressClient,
+    results: list[TestResult],
     tool_name: str,
     category: str,
     endpoint: str,
@@ -118,685 +338,699 @@ async def run_test(
     params: dict[str, Any] | None = None,
     limit: int | None = LIMIT,
     expect_error: type[Exception] | None = None,
+    status_only: bool = False,
 ) -> dict[str, Any] | None:
-    """Execute a single API call with rate-limit retry, record timing and status."""
-    result = TestResult(tool_name=tool_name, category=category)
+    """Execute a single API call with rate-limit retry, recording timing and status.
+
+    With ``status_only`` the call is a HEAD via ``client.head`` and no body is
+    downloaded or decoded; use it for checks that only care about the status.
+    The outcome is appended to ``results``, the calling phase's own list.
+    """
+    response: dict[str, Any] | None = None
+    error_trace = ""
+    paced_ns = 0
+    first_ns = time.perf_counter_ns()
 
     for attempt in range(MAX_RETRIES + 1):
-        start = time.monotonic()
+        # Pacing is not part of the call: take a token, then an in_flight slot,
+        # and only then start the clock
+        pace_ns = time.perf_counter_ns()
+        await bucket.acquire()
         try:
-            response = await client.get(endpoint, params=params, limit=limit)
-            elapsed = (time.monotonic() - start) * 1000
-            result.elapsed_ms = elapsed
-
-            if expect_error:
-                result.status = "FAIL"
-                result.notes = f"Expected {expect_error.__name__} but got 200 OK"
-            else:
-                result.status = "PASS"
-                result.notes = f"{elapsed:.0f}ms"
-
-            results.append(result)
-            await asyncio.sleep(DELAY)
-            return response
-
+            async with in_flight:
+                attempt_ns = time.perf_counter_ns()
+                paced_ns += attempt_ns - pace_ns
+                if status_only:
+                    await client.head(endpoint, params=params)
+                else:
+                    response = await client.get(endpoint, params=params, limit=limit)
         except RateLimitError:
+            # Only a call's first 429 feeds the AIMD bucket; its retries back
+            # off on their own jittered sleep
+            if not attempt:
+                bucket.on_rate_limited()
             if attempt < MAX_RETRIES:
-                wait = RETRY_BASE_DELAY * (attempt + 1)
-                print(f"  Rate limited on {tool_name}, waiting {wait}s (attempt {attempt + 1}/{MAX_RETRIES})...")
+                wait = RETRY_BASE_DELAY * 2**attempt * random.uniform(0.5, 1.5)
+                print(
+                    f"  Rate limited on {tool_name} (pacing at {bucket.rate:.2f} req/s), "
+                    f"retrying in {wait:.1f}s (attempt {attempt + 1}/{MAX_RETRIES})..."
+                )
                 await asyncio.sleep(wait)
                 continue
             # Exhausted retries
-            elapsed = (time.monotonic() - start) * 1000
-            result.elapsed_ms = elapsed
-            result.status = "FAIL"
-            result.notes = "Rate limited after all retries"
-            results.append(result)
-            await asyncio.sleep(DELAY)
-            return None
-
+            elapsed_ns = time.perf_counter_ns() - attempt_ns
+            status, notes = Status.FAIL, "Rate limited after all retries"
         except Exception as e:
-            elapsed = (time.monotonic() - start) * 1000
-            result.elapsed_ms = elapsed
-
+            elapsed_ns = time.perf_counter_ns() - attempt_ns
             if expect_error and isinstance(e, expect_error):
-                result.status = "PASS"
-                result.notes = f"Correctly raised {type(e).__name__}"
+                status, notes = Status.PASS, f"Correctly raised {type(e).__name__}"
             elif isinstance(e, NotFoundError) and not expect_error:
-                result.status = "WARN"
-                result.notes = "404 Not Found (data may not exist)"
-                result.error_trace = str(e)
+                status, notes = Status.WARN, "404 Not Found (data may not exist)"
+                error_trace = str(e)
             else:
-                result.status = "FAIL"
-                result.notes = f"{type(e).__name__}: {e}"
-                result.error_trace = traceback.format_exc()
+                status, notes = Status.FAIL, f"{type(e).__name__}: {e}"
+                # Only hard failures pay for a formatted traceback
+                error_trace = "".join(
+                    traceback.TracebackException.from_exception(e, limit=TRACEBACK_LIMIT).format()
+                )
+        else:
+            elapsed_ns = time.perf_counter_ns() - attempt_ns
+            bucket.on_success()
+            if expect_error:
+                status, notes = Status.FAIL, f"Expected {expect_error.__name__} but got 200 OK"
+            else:
+                status, notes = Status.PASS, f"{ns_to_ms(elapsed_ns)}ms"
+        break
+
+    waited_ns = attempt_ns - first_ns - paced_ns
+    results.append(
+        TestResult(
+            tool_name=tool_name,
+            category=category,
+            status=status,
+            elapsed_ns=elapsed_ns,
+            retries=attempt,
+            waited_ns=waited_ns,
+            paced_ns=paced_ns,
+            notes=notes + retry_note(attempt, waited_ns),
+            error_trace=error_trace,
+        )
+    )
+    return response
+
 
-            results.append(result)
-            await asyncio.sleep(DELAY)
-            return None
+async def run_all[T](*coros: Coroutine[Any, Any, T]) -> list[T]:
+    """Run coroutines concurrently in a TaskGroup; return their results in order.
 
-    return None
+    If one raises, the TaskGroup cancels its siblings and re-raises the errors
+    together as an ExceptionGroup.
+    """
+    async with asyncio.TaskGroup() as tg:
+        tasks = [tg.create_task(coro) for coro in coros]
+    return [task.result() for task in tasks]
 
 
 # ---------------------------------------------------------------------------
 # Phase 0: Infrastructure validation
 # ---------------------------------------------------------------------------
 
-async def phase0_infrastructure(client: CongressClient) -> None:
+async def phase0_infrastructure(client: CongressClient) -> list[TestResult]:
     print("Phase 0: Infrastructure validation...")
-    await run_test(client, "get_congress", "Congress", f"/congress/{CONGRESS}")
-    await run_test(client, "list_congresses", "Congress", "/congress")
+    results: list[TestResult] = []
+    await run_test(client, results, "get_congress", "Congress", f"/congress/{CONGRESS}")
+    await run_test(client, results, "list_congresses", "Congress", "/congress")
+    return results
 
 
 # ---------------------------------------------------------------------------
 # Phase 1: List endpoints — collect IDs
 # ---------------------------------------------------------------------------
 
-async def phase1_list_endpoints(client: CongressClient, ctx: dict[str, Any]) -> None:
+async def phase1_list_endpoints(client: CongressClient, seeds: SeedIds) -> list[TestResult]:
     print("Phase 1: List endpoints...")
-
-    # Bills
-    resp = await run_test(client, "list_bills", "Bills", f"/bill/{CONGRESS}")
-    ctx["bill_type"] = extract(resp, ["bills", "0", "type"], FALLBACKS["bill_type"])
-    if isinstance(ctx["bill_type"], str):
-        ctx["bill_type"] = ctx["bill_type"].lower()
-    ctx["bill_number"] = extract(resp, ["bills", "0", "number"], FALLBACKS["bill_number"])
-
-    await run_test(client, "list_bills_by_type", "Bills", f"/bill/{CONGRESS}/hr")
-
-    # Laws
-    resp = await run_test(client, "list_laws", "Laws", f"/law/{CONGRESS}")
-    ctx["law_number"] = extract(resp, ["bills", "0", "number"], FALLBACKS["law_number"])
-
-    await run_test(client, "list_laws_by_type", "Laws", f"/law/{CONGRESS}/pub")
-
-    # Amendments
-    resp = await run_test(client, "list_amendments", "Amendments", f"/amendment/{CONGRESS}")
-    raw_type = extract(resp, ["amendments", "0", "type"], FALLBACKS["amendment_type"])
-    if isinstance(raw_type, str):
-        ctx["amendment_type"] = raw_type.lower()
-    else:
-        ctx["amendment_type"] = FALLBACKS["amendment_type"]
-    ctx["amendment_number"] = extract(
-        resp, ["amendments", "0", "number"], FALLBACKS["amendment_number"]
-    )
-
-    await run_test(
-        client, "list_amendments_by_type", "Amendments", f"/amendment/{CONGRESS}/samdt"
-    )
-
-    # Members
-    resp = await run_test(
-        client, "list_members", "Members", "/member", params={"currentMember": "true"}
-    )
-    ctx["bioguide_id"] = extract(resp, ["members", "0", "bioguideId"], FALLBACKS["bioguide_id"])
-
-    await run_test(
-        client, "list_members_by_congress", "Members", f"/member/congress/{CONGRESS}"
-    )
-    await run_test(client, "list_members_by_state", "Members", "/member/CA")
-    await run_test(
-        client, "list_members_by_state_and_district", "Members", "/member/CA/12"
-    )
-
-    # Committees
-    resp = await run_test(client, "list_committees", "Committees", "/committee")
-    ctx["committee_code"] = extract(
-        resp, ["committees", "0", "systemCode"], FALLBACKS["committee_code"]
-    )
-
-    resp = await run_test(
-        client, "list_committees_by_chamber", "Committees", "/committee/house"
-    )
-    # Try to extract a house committee code
-    house_code = extract(resp, ["committees", "0", "systemCode"], None)
-    if house_code:
-        ctx["committee_code"] = house_code
-
-    await run_test(
-        client, "list_committees_by_congress", "Committees", f"/committee/{CONGRESS}/house"
-    )
-
-    # Also get a senate committee code
-    resp = await run_test(
-        client,
-        "list_committees_by_chamber(senate)",
-        "Committees",
-        "/committee/senate",
-    )
-    ctx["senate_committee_code"] = extract(
-        resp, ["committees", "0", "systemCode"], FALLBACKS["senate_committee_code"]
-    )
-
-    # Committee Reports
-    resp = await run_test(
-        client, "list_committee_reports", "Committee Reports", f"/committee-report/{CONGRESS}/hrpt"
-    )
-    ctx["report_number"] = extract(
-        resp, ["committeeReports", "0", "number"], FALLBACKS["report_number"]
-    )
-
-    # Committee Prints
-    resp = await run_test(
-        client, "list_committee_prints", "Committee Prints", f"/committee-print/{CONGRESS}/house"
-    )
-    ctx["jacket_number"] = extract(
-        resp, ["committeePrints", "0", "jacketNumber"], FALLBACKS["jacket_number"]
-    )
-
-    # Committee Meetings
-    resp = await run_test(
-        client, "list_committee_meetings", "Committee Meetings", f"/committee-meeting/{CONGRESS}/house"
-    )
-    ctx["event_id"] = extract(
-        resp, ["committeeMeetings", "0", "eventId"], FALLBACKS["event_id"]
-    )
-
-    # Hearings (no chamber — both chambers)
-    await run_test(
-        client, "list_hearings (no chamber)", "Hearings", f"/hearing/{CONGRESS}"
-    )
-
-    # Hearings (with chamber filter)
-    resp = await run_test(
-        client, "list_hearings (with chamber)", "Hearings", f"/hearing/{CONGRESS}/house"
-    )
-    ctx["hearing_jacket_number"] = extract(
-        resp, ["hearings", "0", "jacketNumber"], FALLBACKS["hearing_jacket_number"]
-    )
-
-    # Nominations
-    resp = await run_test(
-        client, "list_nominations", "Nominations", f"/nomination/{CONGRESS}"
-    )
-    ctx["nomination_number"] = extract(
-        resp, ["nominations", "0", "number"], FALLBACKS["nomination_number"]
-    )
-
-    # Treaties
-    resp = await run_test(
-        client, "list_treaties", "Treaties", f"/treaty/{CONGRESS}"
-    )
-    ctx["treaty_number"] = extract(
-        resp, ["treaties", "0", "number"], FALLBACKS["treaty_number"]
-    )
-
-    # Congressional Record
-    resp = await run_test(
-        client, "list_daily_congressional_record", "Congressional Record", "/daily-congressional-record"
-    )
-    ctx["volume_number"] = extract(
-        resp, ["dailyCongressionalRecord", "0", "volumeNumber"], FALLBACKS["volume_number"]
-    )
-
-    # Known upstream API bug: /bound-congressional-record/{year} returns 500.
-    # The bare /bound-congressional-record (no year) works fine.
-    await run_test(
-        client,
-        "list_bound_congressional_record",
-        "Congressional Record",
-        "/bound-congressional-record/2023",
-        expect_error=CongressAPIError,
-    )
-
-    # Communications
-    resp = await run_test(
-        client,
-        "list_house_communications",
-        "Communications",
-        f"/house-communication/{CONGRESS}/ec",
-    )
-    ctx["house_comm_number"] = extract(
-        resp, ["houseCommunications", "0", "number"], FALLBACKS["house_comm_number"]
-    )
-
-    resp = await run_test(
-        client,
-        "list_senate_communications",
-        "Communications",
-        f"/senate-communication/{CONGRESS}/ec",
-    )
-    ctx["senate_comm_number"] = extract(
-        resp, ["senateCommunications", "0", "number"], FALLBACKS["senate_comm_number"]
-    )
-
-    # Votes
-    resp = await run_test(
-        client, "list_house_votes", "Votes", f"/house-vote/{CONGRESS}/1"
-    )
-    ctx["roll_call_number"] = extract(
-        resp, ["houseVotes", "0", "rollCallNumber"], FALLBACKS["roll_call_number"]
-    )
-
-    # Summaries
-    await run_test(client, "list_summaries", "Summaries", "/summaries")
-    await run_test(
-        client, "list_summaries_by_congress", "Summaries", f"/summaries/{CONGRESS}"
-    )
-    await run_test(
-        client, "list_summaries_by_type", "Summaries", f"/summaries/{CONGRESS}/hr"
-    )
-
-    # CRS Reports
-    resp = await run_test(client, "list_crs_reports", "CRS Reports", "/crsreport")
-    ctx["crs_report_number"] = extract(
-        resp, ["CRSReports", "0", "reportNumber"], FALLBACKS["crs_report_number"]
-    )
-
-    # House Requirements
-    resp = await run_test(
-        client, "list_house_requirements", "House Requirements", "/house-requirement"
-    )
-    ctx["requirement_number"] = extract(
-        resp, ["houseRequirements", "0", "number"], FALLBACKS["requirement_number"]
-    )
+    results: list[TestResult] = []
+
+    async def seed(
+        tool_name: str,
+        category: str,
+        endpoint: str,
+        *paths: tuple[str, Callable[[Any], Any]],
+        **kwargs: Any,
+    ) -> None:
+        """Run a list call, then publish the first-item IDs Phase 2 needs from it."""
+        response = await run_test(client, results, tool_name, category, endpoint, **kwargs)
+        for key, path in paths:
+            seeds.publish(key, extract(response, path, FALLBACKS[key]))
+
+    async def seed_committee_code() -> None:
+        # Prefer a house committee code when one is available
+        house_committees, committees = await run_all(
+            run_test(
+                client, results, "list_committees_by_chamber", "Committees", "/committee/house"
+            ),
+            run_test(client, results, "list_committees", "Committees", "/committee"),
+        )
+        fallback = extract(committees, FIRST_COMMITTEE_CODE, FALLBACKS["committee_code"])
+        seeds.publish("committee_code", extract(house_committees, FIRST_COMMITTEE_CODE, fallback))
+
+    await run_all(
+        # List calls whose first result seeds Phase 2
+        seed(
+            "list_bills",
+            "Bills",
+            f"/bill/{CONGRESS}",
+            ("bill_type", FIRST_BILL_TYPE),
+            ("bill_number", FIRST_BILL_NUMBER),
+        ),
+        seed("list_laws", "Laws", f"/law/{CONGRESS}", ("law_number", FIRST_BILL_NUMBER)),
+        seed(
+            "list_amendments",
+            "Amendments",
+            f"/amendment/{CONGRESS}",
+            ("amendment_type", FIRST_AMENDMENT_TYPE),
+            ("amendment_number", FIRST_AMENDMENT_NUMBER),
+        ),
+        seed(
+            "list_members",
+            "Members",
+            "/member",
+            ("bioguide_id", FIRST_BIOGUIDE_ID),
+            params={"currentMember": "true"},
+        ),
+        seed_committee_code(),
+        seed(
+            "list_committees_by_chamber(senate)",
+            "Committees",
+            "/committee/senate",
+            ("senate_committee_code", FIRST_COMMITTEE_CODE),
+        ),
+        seed(
+            "list_committee_reports",
+            "Committee Reports",
+            f"/committee-report/{CONGRESS}/hrpt",
+            ("report_number", FIRST_REPORT_NUMBER),
+        ),
+        seed(
+            "list_committee_prints",
+            "Committee Prints",
+            f"/committee-print/{CONGRESS}/house",
+            ("jacket_number", FIRST_PRINT_JACKET_NUMBER),
+        ),
+        seed(
+            "list_committee_meetings",
+            "Committee Meetings",
+            f"/committee-meeting/{CONGRESS}/house",
+            ("event_id", FIRST_MEETING_EVENT_ID),
+        ),
+        # Hearings (with chamber filter)
+        seed(
+            "list_hearings (with chamber)",
+            "Hearings",
+            f"/hearing/{CONGRESS}/house",
+            ("hearing_jacket_number", FIRST_HEARING_JACKET_NUMBER),
+        ),
+        seed(
+            "list_nominations",
+            "Nominations",
+            f"/nomination/{CONGRESS}",
+            ("nomination_number", FIRST_NOMINATION_NUMBER),
+        ),
+        seed(
+            "list_treaties",
+            "Treaties",
+            f"/treaty/{CONGRESS}",
+            ("treaty_number", FIRST_TREATY_NUMBER),
+        ),
+        seed(
+            "list_daily_congressional_record",
+            "Congressional Record",
+            "/daily-congressional-record",
+            ("volume_number", FIRST_VOLUME_NUMBER),
+        ),
+        seed(
+            "list_house_communications",
+            "Communications",
+            f"/house-communication/{CONGRESS}/ec",
+            ("house_comm_number", FIRST_HOUSE_COMM_NUMBER),
+        ),
+        seed(
+            "list_senate_communications",
+            "Communications",
+            f"/senate-communication/{CONGRESS}/ec",
+            ("senate_comm_number", FIRST_SENATE_COMM_NUMBER),
+        ),
+        seed(
+            "list_house_votes",
+            "Votes",
+            f"/house-vote/{CONGRESS}/1",
+            ("roll_call_number", FIRST_ROLL_CALL_NUMBER),
+        ),
+        seed(
+            "list_crs_reports",
+            "CRS Reports",
+            "/crsreport",
+            ("crs_report_number", FIRST_CRS_REPORT_NUMBER),
+        ),
+        seed(
+            "list_house_requirements",
+            "House Requirements",
+            "/house-requirement",
+            ("requirement_number", FIRST_REQUIREMENT_NUMBER),
+        ),
+        # List calls that only need to succeed
+        run_test(client, results, "list_bills_by_type", "Bills", f"/bill/{CONGRESS}/hr"),
+        run_test(client, results, "list_laws_by_type", "Laws", f"/law/{CONGRESS}/pub"),
+        run_test(
+            client, results, "list_amendments_by_type", "Amendments", f"/amendment/{CONGRESS}/samdt"
+        ),
+        run_test(
+            client, results, "list_members_by_congress", "Members", f"/member/congress/{CONGRESS}"
+        ),
+        run_test(client, results, "list_members_by_state", "Members", "/member/CA"),
+        run_test(client, results, "list_members_by_state_and_district", "Members", "/member/CA/12"),
+        run_test(
+            client,
+            results,
+            "list_committees_by_congress",
+            "Committees",
+            f"/committee/{CONGRESS}/house",
+        ),
+        # Hearings (no chamber — both chambers)
+        run_test(client, results, "list_hearings (no chamber)", "Hearings", f"/hearing/{CONGRESS}"),
+        # Known upstream API bug: /bound-congressional-record/{year} returns 500.
+        # The bare /bound-congressional-record (no year) works fine.
+        run_test(
+            client,
+            results,
+            "list_bound_congressional_record",
+            "Congressional Record",
+            "/bound-congressional-record/2023",
+            expect_error=CongressAPIError,
+        ),
+        run_test(client, results, "list_summaries", "Summaries", "/summaries"),
+        run_test(
+            client, results, "list_summaries_by_congress", "Summaries", f"/summaries/{CONGRESS}"
+        ),
+        run_test(
+            client, results, "list_summaries_by_type", "Summaries", f"/summaries/{CONGRESS}/hr"
+        ),
+    )
+    # Release any Phase 2 call still waiting on an ID no list call published
+    seeds.close()
+    return results
 
 
 # ---------------------------------------------------------------------------
-# Phase 2: Detail endpoints — use extracted IDs
+# Phase 2 registry
 # ---------------------------------------------------------------------------
 
-async def phase2_detail_endpoints(client: CongressClient, ctx: dict[str, Any]) -> None:
-    print("Phase 2: Detail endpoints...")
-
-    bt = ctx.get("bill_type", FALLBACKS["bill_type"])
-    bn = ctx.get("bill_number", FALLBACKS["bill_number"])
-    at = ctx.get("amendment_type", FALLBACKS["amendment_type"])
-    an = ctx.get("amendment_number", FALLBACKS["amendment_number"])
-    bio = ctx.get("bioguide_id", FALLBACKS["bioguide_id"])
-    cc = ctx.get("committee_code", FALLBACKS["committee_code"])
-    scc = ctx.get("senate_committee_code", FALLBACKS["senate_committee_code"])
-    rn = ctx.get("report_number", FALLBACKS["report_number"])
-    jn = ctx.get("jacket_number", FALLBACKS["jacket_number"])
-    eid = ctx.get("event_id", FALLBACKS["event_id"])
-    hjn = ctx.get("hearing_jacket_number", FALLBACKS["hearing_jacket_number"])
-    nn = ctx.get("nomination_number", FALLBACKS["nomination_number"])
-    tn = ctx.get("treaty_number", FALLBACKS["treaty_number"])
-    vn = ctx.get("volume_number", FALLBACKS["volume_number"])
-    ln = ctx.get("law_number", FALLBACKS["law_number"])
-    hcn = ctx.get("house_comm_number", FALLBACKS["house_comm_number"])
-    scn = ctx.get("senate_comm_number", FALLBACKS["senate_comm_number"])
-    rcn = ctx.get("roll_call_number", FALLBACKS["roll_call_number"])
-    crn = ctx.get("crs_report_number", FALLBACKS["crs_report_number"])
-    reqn = ctx.get("requirement_number", FALLBACKS["requirement_number"])
+BILL = "/bill/{congress}/{bill_type}/{bill_number}"
+AMENDMENT = "/amendment/{congress}/{amendment_type}/{amendment_number}"
 
+# Detail calls, grouped by resource family: (tool_name, category, endpoint
+# template, run_test kwargs). Templates are filled from the Phase 1 IDs.
+PHASE2_SPECS: tuple[tuple[str, str, str, dict[str, Any]], ...] = (
     # --- Bills (10) ---
-    await run_test(client, "get_bill", "Bills", f"/bill/{CONGRESS}/{bt}/{bn}")
-    await run_test(client, "get_bill_actions", "Bills", f"/bill/{CONGRESS}/{bt}/{bn}/actions")
-    await run_test(client, "get_bill_amendments", "Bills", f"/bill/{CONGRESS}/{bt}/{bn}/amendments")
-    await run_test(client, "get_bill_committees", "Bills", f"/bill/{CONGRESS}/{bt}/{bn}/committees")
-    await run_test(client, "get_bill_cosponsors", "Bills", f"/bill/{CONGRESS}/{bt}/{bn}/cosponsors")
-    await run_test(
-        client, "get_bill_related_bills", "Bills", f"/bill/{CONGRESS}/{bt}/{bn}/relatedbills"
-    )
-    await run_test(client, "get_bill_subjects", "Bills", f"/bill/{CONGRESS}/{bt}/{bn}/subjects")
-    await run_test(client, "get_bill_summaries", "Bills", f"/bill/{CONGRESS}/{bt}/{bn}/summaries")
-    await run_test(client, "get_bill_text", "Bills", f"/bill/{CONGRESS}/{bt}/{bn}/text")
-    await run_test(client, "get_bill_titles", "Bills", f"/bill/{CONGRESS}/{bt}/{bn}/titles")
+    ("get_bill", "Bills", BILL, {}),
+    ("get_bill_actions", "Bills", BILL + "/actions", {}),
+    ("get_bill_amendments", "Bills", BILL + "/amendments", {}),
+    ("get_bill_committees", "Bills", BILL + "/committees", {}),
+    ("get_bill_cosponsors", "Bills", BILL + "/cosponsors", {}),
+    ("get_bill_related_bills", "Bills", BILL + "/relatedbills", {}),
+    ("get_bill_subjects", "Bills", BILL + "/subjects", {}),
+    ("get_bill_summaries", "Bills", BILL + "/summaries", {}),
+    ("get_bill_text", "Bills", BILL + "/text", {}),
+    ("get_bill_titles", "Bills", BILL + "/titles", {}),
 
     # --- Laws (1) ---
-    await run_test(client, "get_law", "Laws", f"/law/{CONGRESS}/pub/{ln}")
+    ("get_law", "Laws", "/law/{congress}/pub/{law_number}", {}),
 
     # --- Amendments (5) ---
-    await run_test(
-        client, "get_amendment", "Amendments", f"/amendment/{CONGRESS}/{at}/{an}"
-    )
-    await run_test(
-        client, "get_amendment_actions", "Amendments", f"/amendment/{CONGRESS}/{at}/{an}/actions"
-    )
-    await run_test(
-        client,
-        "get_amendment_cosponsors",
-        "Amendments",
-        f"/amendment/{CONGRESS}/{at}/{an}/cosponsors",
-    )
-    await run_test(
-        client,
-        "get_amendment_amendments",
-        "Amendments",
-        f"/amendment/{CONGRESS}/{at}/{an}/amendments",
-    )
-    await run_test(
-        client, "get_amendment_text", "Amendments", f"/amendment/{CONGRESS}/{at}/{an}/text"
-    )
+    ("get_amendment", "Amendments", AMENDMENT, {}),
+    ("get_amendment_actions", "Amendments", AMENDMENT + "/actions", {}),
+    ("get_amendment_cosponsors", "Amendments", AMENDMENT + "/cosponsors", {}),
+    ("get_amendment_amendments", "Amendments", AMENDMENT + "/amendments", {}),
+    ("get_amendment_text", "Amendments", AMENDMENT + "/text", {}),
 
     # --- Members (3) ---
-    await run_test(client, "get_member", "Members", f"/member/{bio}")
-    await run_test(
-        client,
+    ("get_member", "Members", "/member/{bioguide_id}", {}),
+    (
         "get_member_sponsored_legislation",
         "Members",
-        f"/member/{bio}/sponsored-legislation",
-    )
-    await run_test(
-        client,
+        "/member/{bioguide_id}/sponsored-legislation",
+        {},
+    ),
+    (
         "get_member_cosponsored_legislation",
         "Members",
-        f"/member/{bio}/cosponsored-legislation",
-    )
+        "/member/{bioguide_id}/cosponsored-legislation",
+        {},
+    ),
 
     # --- Committees (7) ---
-    await run_test(
-        client, "get_committee", "Committees", f"/committee/house/{cc}"
-    )
-    await run_test(
-        client,
-        "get_committee_by_congress",
-        "Committees",
-        f"/committee/{CONGRESS}/house/{cc}",
-    )
-    await run_test(
-        client, "get_committee_bills", "Committees", f"/committee/house/{cc}/bills"
-    )
-    await run_test(
-        client,
-        "get_committee_reports_list",
-        "Committees",
-        f"/committee/house/{cc}/reports",
-    )
-    await run_test(
-        client,
+    ("get_committee", "Committees", "/committee/house/{committee_code}", {}),
+    ("get_committee_by_congress", "Committees", "/committee/{congress}/house/{committee_code}", {}),
+    ("get_committee_bills", "Committees", "/committee/house/{committee_code}/bills", {}),
+    ("get_committee_reports_list", "Committees", "/committee/house/{committee_code}/reports", {}),
+    (
         "get_committee_nominations",
         "Committees",
-        f"/committee/senate/{scc}/nominations",
-    )
-    await run_test(
-        client,
+        "/committee/senate/{senate_committee_code}/nominations",
+        {},
+    ),
+    (
         "get_committee_house_communications",
         "Committees",
-        f"/committee/house/{cc}/house-communication",
-    )
-    await run_test(
-        client,
+        "/committee/house/{committee_code}/house-communication",
+        {},
+    ),
+    (
         "get_committee_senate_communications",
         "Committees",
-        f"/committee/senate/{scc}/senate-communication",
-    )
+        "/committee/senate/{senate_committee_code}/senate-communication",
+        {},
+    ),
 
     # --- Committee Reports (2) ---
-    await run_test(
-        client,
+    (
         "get_committee_report",
         "Committee Reports",
-        f"/committee-report/{CONGRESS}/hrpt/{rn}",
-    )
-    await run_test(
-        client,
+        "/committee-report/{congress}/hrpt/{report_number}",
+        {},
+    ),
+    (
         "get_committee_report_text",
         "Committee Reports",
-        f"/committee-report/{CONGRESS}/hrpt/{rn}/text",
-    )
+        "/committee-report/{congress}/hrpt/{report_number}/text",
+        {},
+    ),
 
     # --- Committee Prints (2) ---
-    await run_test(
-        client,
+    (
         "get_committee_print",
         "Committee Prints",
-        f"/committee-print/{CONGRESS}/house/{jn}",
-    )
-    await run_test(
-        client,
+        "/committee-print/{congress}/house/{jacket_number}",
+        {},
+    ),
+    (
         "get_committee_print_text",
         "Committee Prints",
-        f"/committee-print/{CONGRESS}/house/{jn}/text",
-    )
+        "/committee-print/{congress}/house/{jacket_number}/text",
+        {},
+    ),
 
     # --- Committee Meetings (1) ---
-    await run_test(
-        client,
+    (
         "get_committee_meeting",
         "Committee Meetings",
-        f"/committee-meeting/{CONGRESS}/house/{eid}",
-    )
+        "/committee-meeting/{congress}/house/{event_id}",
+        {},
+    ),
 
     # --- Hearings (1) ---
-    await run_test(
-        client, "get_hearing", "Hearings", f"/hearing/{CONGRESS}/house/{hjn}"
-    )
+    ("get_hearing", "Hearings", "/hearing/{congress}/house/{hearing_jacket_number}", {}),
 
     # --- Nominations (5) ---
-    await run_test(
-        client, "get_nomination", "Nominations", f"/nomination/{CONGRESS}/{nn}"
-    )
-    await run_test(
-        client, "get_nomination_nominees", "Nominations", f"/nomination/{CONGRESS}/{nn}/1"
-    )
-    await run_test(
-        client,
+    ("get_nomination", "Nominations", "/nomination/{congress}/{nomination_number}", {}),
+    ("get_nomination_nominees", "Nominations", "/nomination/{congress}/{nomination_number}/1", {}),
+    (
         "get_nomination_actions",
         "Nominations",
-        f"/nomination/{CONGRESS}/{nn}/actions",
-    )
-    await run_test(
-        client,
+        "/nomination/{congress}/{nomination_number}/actions",
+        {},
+    ),
+    (
         "get_nomination_committees",
         "Nominations",
-        f"/nomination/{CONGRESS}/{nn}/committees",
-    )
-    await run_test(
-        client,
+        "/nomination/{congress}/{nomination_number}/committees",
+        {},
+    ),
+    (
         "get_nomination_hearings",
         "Nominations",
-        f"/nomination/{CONGRESS}/{nn}/hearings",
-    )
+        "/nomination/{congress}/{nomination_number}/hearings",
+        {},
+    ),
 
     # --- Treaties (4) ---
-    await run_test(client, "get_treaty", "Treaties", f"/treaty/{CONGRESS}/{tn}")
-    await run_test(
-        client, "get_treaty_actions", "Treaties", f"/treaty/{CONGRESS}/{tn}/actions"
-    )
-    await run_test(
-        client, "get_treaty_committees", "Treaties", f"/treaty/{CONGRESS}/{tn}/committees"
-    )
+    ("get_treaty", "Treaties", "/treaty/{congress}/{treaty_number}", {}),
+    ("get_treaty_actions", "Treaties", "/treaty/{congress}/{treaty_number}/actions", {}),
+    ("get_treaty_committees", "Treaties", "/treaty/{congress}/{treaty_number}/committees", {}),
     # Treaty part may not exist for all treaties — mark as WARN if 404
-    await run_test(
-        client, "get_treaty_part", "Treaties", f"/treaty/{CONGRESS}/{tn}/A"
-    )
+    ("get_treaty_part", "Treaties", "/treaty/{congress}/{treaty_number}/A", {}),
 
     # --- Congressional Record (5) ---
-    await run_test(
-        client,
+    (
         "list_daily_congressional_record_by_volume",
         "Congressional Record",
-        f"/daily-congressional-record/{vn}",
-    )
-    await run_test(
-        client,
+        "/daily-congressional-record/{volume_number}",
+        {},
+    ),
+    (
         "get_daily_congressional_record_issue",
         "Congressional Record",
-        f"/daily-congressional-record/{vn}/1",
-    )
-    await run_test(
-        client,
+        "/daily-congressional-record/{volume_number}/1",
+        {},
+    ),
+    (
         "get_daily_congressional_record_articles",
         "Congressional Record",
-        f"/daily-congressional-record/{vn}/1/articles",
-    )
+        "/daily-congressional-record/{volume_number}/1/articles",
+        {},
+    ),
     # Known upstream API bug: /bound-congressional-record/{year}/{month} returns 500.
-    await run_test(
-        client,
+    (
         "list_bound_congressional_record_by_month",
         "Congressional Record",
         "/bound-congressional-record/2023/3",
-        expect_error=CongressAPIError,
-    )
-    await run_test(
-        client,
+        {"expect_error": CongressAPIError},
+    ),
+    (
         "get_bound_congressional_record_by_date",
         "Congressional Record",
         "/bound-congressional-record/2023/3/22",
-    )
+        {},
+    ),
 
     # --- Communications (2) ---
-    await run_test(
-        client,
+    (
         "get_house_communication",
         "Communications",
-        f"/house-communication/{CONGRESS}/ec/{hcn}",
-    )
-    await run_test(
-        client,
+        "/house-communication/{congress}/ec/{house_comm_number}",
+        {},
+    ),
+    (
         "get_senate_communication",
         "Communications",
-        f"/senate-communication/{CONGRESS}/ec/{scn}",
-    )
+        "/senate-communication/{congress}/ec/{senate_comm_number}",
+        {},
+    ),
 
     # --- Votes (2) ---
-    await run_test(
-        client, "get_house_vote", "Votes", f"/house-vote/{CONGRESS}/1/{rcn}"
-    )
-    await run_test(
-        client,
-        "get_house_vote_members",
-        "Votes",
-        f"/house-vote/{CONGRESS}/1/{rcn}/members",
-    )
+    ("get_house_vote", "Votes", "/house-vote/{congress}/1/{roll_call_number}", {}),
+    ("get_house_vote_members", "Votes", "/house-vote/{congress}/1/{roll_call_number}/members", {}),
 
     # --- CRS Reports (1) ---
-    await run_test(client, "get_crs_report", "CRS Reports", f"/crsreport/{crn}")
+    ("get_crs_report", "CRS Reports", "/crsreport/{crs_report_number}", {}),
 
     # --- House Requirements (2) ---
-    await run_test(
-        client,
-        "get_house_requirement",
-        "House Requirements",
-        f"/house-requirement/{reqn}",
-    )
-    await run_test(
-        client,
+    ("get_house_requirement", "House Requirements", "/house-requirement/{requirement_number}", {}),
+    (
         "get_house_requirement_communications",
         "House Requirements",
-        f"/house-requirement/{reqn}/matching-communications",
+        "/house-requirement/{requirement_number}/matching-communications",
+        {},
+    ),
+)
+
+# The Phase 1 IDs each template waits for ({congress} is a constant)
+PHASE2_FIELDS: dict[str, tuple[str, ...]] = {
+    template: tuple(
+        name for _, name, _, _ in string.Formatter().parse(template) if name and name != "congress"
     )
+    for _, _, template, _ in PHASE2_SPECS
+}
+
+
+# ---------------------------------------------------------------------------
+# Phase 2: Detail endpoints — use extracted IDs
+# ---------------------------------------------------------------------------
+
+async def phase2_detail_endpoints(client: CongressClient, seeds: SeedIds) -> list[TestResult]:
+    print("Phase 2: Detail endpoints...")
+    results: list[TestResult] = []
+
+    async def detail(tool_name: str, category: str, template: str, kwargs: dict[str, Any]) -> None:
+        ids = {"congress": CONGRESS}
+        for name in PHASE2_FIELDS[template]:
+            ids[name] = await seeds.get(name)
+        await run_test(client, results, tool_name, category, template.format_map(ids), **kwargs)
+
+    await run_all(*(detail(*spec) for spec in PHASE2_SPECS))
+    return results
+
+
+async def pipelined_list_and_detail(client: CongressClient, seeds: SeedIds) -> list[TestResult]:
+    """Run Phases 1 and 2 together; each detail call waits only on its own IDs."""
+    list_results, detail_results = await run_all(
+        phase1_list_endpoints(client, seeds), phase2_detail_endpoints(client, seeds)
+    )
+    return list_results + detail_results
 
 
 # ---------------------------------------------------------------------------
 # Phase 3: Error handling
 # ---------------------------------------------------------------------------
 
-async def phase3_error_handling(client: CongressClient) -> None:
+async def phase3_error_handling(client: CongressClient) -> list[TestResult]:
     print("Phase 3: Error handling...")
+    results: list[TestResult] = []
 
     await run_test(
         client,
+        results,
         "get_bill (invalid)",
         "Error Handling",
         "/bill/999/hr/99999",
         expect_error=NotFoundError,
+        status_only=True,
     )
     await run_test(
         client,
+        results,
         "get_member (invalid)",
         "Error Handling",
         "/member/ZZZZZZZ",
         expect_error=NotFoundError,
+        status_only=True,
     )
     await run_test(
         client,
+        results,
         "get_law (invalid)",
         "Error Handling",
         "/law/118/pub/99999",
         expect_error=NotFoundError,
+        status_only=True,
     )
     await run_test(
         client,
+        results,
         "get_nomination (invalid)",
         "Error Handling",
         "/nomination/999/99999",
         expect_error=NotFoundError,
+        status_only=True,
     )
     # Congress.gov API returns 500 (not 404) for invalid CRS reports.
     # The MCP tool layer converts this to NotFoundError, but at the
     # client level it surfaces as CongressAPIError.
     await run_test(
         client,
+        results,
         "get_crs_report (invalid)",
         "Error Handling",
         "/crsreport/ZZZZZZZ",
         expect_error=CongressAPIError,
+        status_only=True,
     )
+    return results
 
 
 # ---------------------------------------------------------------------------
 # Report generation
 # ---------------------------------------------------------------------------
 
+@dataclass
+class Summary:
+    """Everything the report needs from the results, gathered in one pass."""
+
+    total: int = 0
+    counts: list[int] = field(default_factory=lambda: [0] * len(Status))
+    categories: dict[str, list[TestResult]] = field(default_factory=dict)
+    category_passed: dict[str, int] = field(default_factory=dict)
+    failures: list[TestResult] = field(default_factory=list)
+    warnings: list[TestResult] = field(default_factory=list)
+
+    @property
+    def passed(self) -> int:
+        return self.counts[Status.PASS]
+
+    @property
+    def failed(self) -> int:
+        return self.counts[Status.FAIL]
+
+    @property
+    def warned(self) -> int:
+        return self.counts[Status.WARN]
+
+
+def summarize(results: list[TestResult]) -> Summary:
+    summary = Summary(total=len(results))
+    for r in results:
+        summary.counts[r.status] += 1
+        summary.categories.setdefault(r.category, []).append(r)
+        passed = r.status is Status.PASS
+        summary.category_passed[r.category] = summary.category_passed.get(r.category, 0) + passed
+        if r.status is Status.FAIL:
+            summary.failures.append(r)
+        elif r.status is Status.WARN:
+            summary.warnings.append(r)
+    return summary
+
+
 def generate_report(
-    start_time: datetime, end_time: datetime, ctx: dict[str, Any]
+    summary: Summary,
+    phase_timings: list[tuple[str, int, float]],
+    start_time: datetime,
+    duration: float,
+    ids: dict[str, Any],
 ) -> str:
-    duration = (end_time - start_time).total_seconds()
-    passed = sum(1 for r in results if r.status == "PASS")
-    failed = sum(1 for r in results if r.status == "FAIL")
-    warned = sum(1 for r in results if r.status == "WARN")
-    total = len(results)
-
-    lines: list[str] = []
-    lines.append("# Congress.gov MCP Server - Integration Test Report\n")
-    lines.append(f"**Date**: {start_time.strftime('%Y-%m-%d %H:%M:%S UTC')}")
-    lines.append(f"**Duration**: {duration:.1f} seconds")
-    lines.append(f"**Congress**: {CONGRESS}th (2023-2025)")
-    lines.append(f"**API Base**: https://api.congress.gov/v3\n")
-
-    lines.append("## Summary\n")
-    lines.append("| Metric | Count |")
-    lines.append("|--------|-------|")
-    lines.append(f"| Total Tests | {total} |")
-    lines.append(f"| Passed | {passed} |")
-    lines.append(f"| Failed | {failed} |")
-    lines.append(f"| Warnings | {warned} |")
-    lines.append(f"| Pass Rate | {passed/total*100:.1f}% |")
-    lines.append("")
-
-    # Group results by category
-    categories: dict[str, list[TestResult]] = {}
-    for r in results:
-        categories.setdefault(r.category, []).append(r)
-
-    lines.append("## Results by Category\n")
-    for category, cat_results in categories.items():
-        cat_passed = sum(1 for r in cat_results if r.status == "PASS")
-        cat_total = len(cat_results)
-        lines.append(f"### {category} ({cat_passed}/{cat_total} passed)\n")
-        lines.append("| # | Tool | Status | Time (ms) | Notes |")
-        lines.append("|---|------|--------|-----------|-------|")
+    passed, total = summary.passed, summary.total
+
+    out = io.StringIO()
+    write = out.write
+    write("# Congress.gov MCP Server - Integration Test Report\n\n")
+    write(f"**Date**: {start_time.strftime('%Y-%m-%d %H:%M:%S UTC')}\n")
+    write(f"**Duration**: {duration:.1f} seconds\n")
+    write(f"**Congress**: {CONGRESS}th (2023-2025)\n")
+    write("**API Base**: https://api.congress.gov/v3\n\n")
+
+    write("## Summary\n\n")
+    write("| Metric | Count |\n")
+    write("|--------|-------|\n")
+    write(f"| Total Tests | {total} |\n")
+    write(f"| Passed | {passed} |\n")
+    write(f"| Failed | {summary.failed} |\n")
+    write(f"| Warnings | {summary.warned} |\n")
+    write(f"| Pass Rate | {passed/total*100:.1f}% |\n\n")
+
+    write("## Phase Timing\n\n")
+    write("| Phase | Tests | Seconds |\n")
+    write("|-------|-------|---------|\n")
+    for name, count, seconds in phase_timings:
+        write(f"| {name} | {count} | {seconds:.1f} |\n")
+    write("\n")
+
+    write("## Results by Category\n\n")
+    for category, cat_results in summary.categories.items():
+        cat_passed = summary.category_passed[category]
+        write(f"### {category} ({cat_passed}/{len(cat_results)} passed)\n\n")
+        write("| # | Tool | Status | Time (ms) | Paced (ms) | Notes |\n")
+        write("|---|------|--------|-----------|------------|-------|\n")
         for i, r in enumerate(cat_results, 1):
-            status_icon = {"PASS": "PASS", "FAIL": "**FAIL**", "WARN": "WARN", "SKIP": "SKIP"}[
-                r.status
-            ]
-            lines.append(
-                f"| {i} | `{r.tool_name}` | {status_icon} | {r.elapsed_ms:.0f} | {r.notes} |"
+            icon = STATUS_ICONS[r.status]
+            write(
+                f"| {i} | `{r.tool_name}` | {icon} | {r.elapsed_ms} | {r.paced_ms} | {r.notes} |\n"
             )
-        lines.append("")
+        write("\n")
 
     # Failures detail
-    failures = [r for r in results if r.status == "FAIL"]
-    if failures:
-        lines.append("## Failures\n")
-        for r in failures:
-            lines.append(f"### `{r.tool_name}` ({r.category})")
-            lines.append(f"- **Notes**: {r.notes}")
+    if summary.failures:
+        write("## Failures\n\n")
+        for r in summary.failures:
+            write(f"### `{r.tool_name}` ({r.category})\n")
+            write(f"- **Notes**: {r.notes}\n")
             if r.error_trace:
-                lines.append(f"- **Traceback**:\n```\n{r.error_trace}\n```")
-            lines.append("")
+                write(f"- **Traceback**:\n```\n{r.error_trace}\n```\n")
+            write("\n")
 
     # Warnings detail
-    warnings = [r for r in results if r.status == "WARN"]
-    if warnings:
-        lines.append("## Warnings\n")
-        for r in warnings:
-            lines.append(f"- `{r.tool_name}` ({r.category}): {r.notes}")
-        lines.append("")
+    if summary.warnings:
+        write("## Warnings\n\n")
+        for r in summary.warnings:
+            write(f"- `{r.tool_name}` ({r.category}): {r.notes}\n")
+        write("\n")
 
     # Extracted IDs
-    lines.append("## Extracted IDs Used\n")
-    lines.append("| Parameter | Value | Source |")
-    lines.append("|-----------|-------|--------|")
-    for key, value in sorted(ctx.items()):
-        source = "fallback" if value == FALLBACKS.get(key) else "extracted"
-        lines.append(f"| {key} | `{value}` | {source} |")
-    lines.append("")
+    write("## Extracted IDs Used\n\n")
+    write("| Parameter | Value | Source |\n")
+    write("|-----------|-------|--------|\n")
+    for key, value in sorted(ids.items()):
+        source = "fallback" if (key, value) in FALLBACK_ITEMS else "extracted"
+        write(f"| {key} | `{value}` | {source} |\n")
 
-    return "\n".join(lines)
+    return out.getvalue()
 
 
 # ---------------------------------------------------------------------------
@@ -805,51 +1039,69 @@ def generate_report(
 
 async def main() -> None:
     try:
-        config = Config.from_env()
+        # run_test owns 429 retries and backoff; a client-side retry would sleep
+        # while holding an in_flight slot and hide 429s from the AIMD bucket
+        config = replace(Config.from_env(), max_retries=0)
     except ValueError as e:
         print(f"Error: {e}")
         sys.exit(1)
 
-    ctx: dict[str, Any] = {}
+    phase_results: list[list[TestResult]] = []
+    phase_timings: list[tuple[str, int, float]] = []
     start_time = datetime.now(timezone.utc)
+    started = time.perf_counter()
 
     print(f"Starting integration test against live Congress.gov API (Congress {CONGRESS})...")
     print(f"API base: {config.base_url}\n")
 
-    async with CongressClient(config) as client:
-        await phase0_infrastructure(client)
-        await phase1_list_endpoints(client, ctx)
-        await phase2_detail_endpoints(client, ctx)
-        await phase3_error_handling(client)
-
-    end_time = datetime.now(timezone.utc)
-
-    report = generate_report(start_time, end_time, ctx)
+    async with CongressClient(config, json_loads=json_loads) as client:
+        seeds = SeedIds()
+        phases: tuple[tuple[str, Callable[[], Awaitable[list[TestResult]]]], ...] = (
+            ("Infrastructure", lambda: phase0_infrastructure(client)),
+            ("List + detail endpoints", lambda: pipelined_list_and_detail(client, seeds)),
+            ("Error handling", lambda: phase3_error_handling(client)),
+        )
+        for name, run_phase in phases:
+            phase_start = time.perf_counter()
+            phase = await run_phase()
+            phase_results.append(phase)
+            phase_timings.append((name, len(phase), time.perf_counter() - phase_start))
+
+    duration = time.perf_counter() - started
+    results = [r for phase in phase_results for r in phase]
+
+    summary = summarize(results)
+    report = generate_report(summary, phase_timings, start_time, duration, seeds.values)
 
     report_path = Path(__file__).parent.parent / ".context" / "integration-test-report.md"
     report_path.parent.mkdir(parents=True, exist_ok=True)
-    report_path.write_text(report)
+    report_path.write_text(report, encoding="utf-8", newline="\n")
 
     # Print summary
-    passed = sum(1 for r in results if r.status == "PASS")
-    failed = sum(1 for r in results if r.status == "FAIL")
-    warned = sum(1 for r in results if r.status == "WARN")
-    total = len(results)
-
     print(f"\n{'='*60}")
-    print(f"Results: {passed} passed, {failed} failed, {warned} warnings, {total} total")
+    print(
+        f"Results: {summary.passed} passed, {summary.failed} failed, "
+        f"{summary.warned} warnings, {summary.total} total"
+    )
     print(f"Report: {report_path}")
-    print(f"Duration: {(end_time - start_time).total_seconds():.1f}s")
+    print(f"Duration: {duration:.1f}s")
     print(f"{'='*60}")
 
-    if failed > 0:
+    if summary.failures:
         print("\nFailed tests:")
-        for r in results:
-            if r.status == "FAIL":
-                print(f"  - {r.tool_name}: {r.notes}")
+        for r in summary.failures:
+            print(f"  - {r.tool_name}: {r.notes}")
 
-    sys.exit(1 if failed > 0 else 0)
+    sys.exit(1 if summary.failures else 0)
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    # uvloop is optional: use it when installed, otherwise the stock asyncio loop
+    try:
+        import uvloop
+    except ImportError:
+        loop_factory = None
+    else:
+        loop_factory = uvloop.new_event_loop
+    with asyncio.Runner(loop_factory=loop_factory) as runner:
+        runner.run(main())
@@ -1,13 +1,21 @@
 """Tests for auto-pagination functionality."""
 
+from collections.abc import Callable
+from contextlib import aclosing
 from typing import Any
-from unittest.mock import AsyncMock, MagicMock, patch
 
+import httpx
 import pytest
 
 from congress_mcp.client import CongressClient
 from congress_mcp.config import Config
 
+# Canned bill records, built once and sliced into pages by the tests below.
+# get_all copies pages into its own result list, so sharing them is safe.
+_BILLS = [{"number": i} for i in range(1000)]
+_PAGES_400 = {offset: _BILLS[offset : min(offset + 250, 400)] for offset in range(0, 400, 250)}
+_PAGES_1000 = {offset: _BILLS[offset : offset + 250] for offset in range(0, 1000, 250)}
+
 
 @pytest.fixture
 def config() -> Config:
@@ -21,164 +29,218 @@ def config() -> Config:
     )
 
 
+def mock_http_client(
+    config: Config, handler: Callable[[httpx.Request], httpx.Response]
+) -> httpx.AsyncClient:
+    """Create a real httpx client whose requests are answered by handler."""
+    return httpx.AsyncClient(base_url=config.base_url, transport=httpx.MockTransport(handler))
+
+
 class TestPagination:
     """Tests for auto-pagination in CongressClient."""
 
     @pytest.mark.asyncio
     async def test_get_all_single_page(self, config: Config) -> None:
         """Single page of results is returned correctly."""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "bills": [{"number": i} for i in range(50)],
-            "pagination": {"count": 50},
-        }
 
-        with patch("httpx.AsyncClient") as mock_client_class:
-            mock_client = AsyncMock()
-            mock_client.get = AsyncMock(return_value=mock_response)
-            mock_client.aclose = AsyncMock()
-            mock_client_class.return_value = mock_client
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, json={"bills": _BILLS[:50], "pagination": {"count": 50}})
 
-            async with CongressClient(config) as client:
-                result = await client.get_all("/bill/118")
+        async with (
+            mock_http_client(config, handler) as http_client,
+            CongressClient(config, http_client=http_client) as client,
+        ):
+            result = await client.get_all("/bill/118")
 
-            assert len(result["results"]) == 50
-            assert result["count"] == 50
+        assert len(result["results"]) == 50
+        assert result["count"] == 50
 
     @pytest.mark.asyncio
     async def test_get_all_multiple_pages(self, config: Config) -> None:
         """Multiple pages are fetched and combined."""
-        # First page: 250 items (max), total count 400
-        # Second page: 150 items
-        responses = [
-            {
-                "bills": [{"number": i} for i in range(250)],
-                "pagination": {"count": 400},
-            },
-            {
-                "bills": [{"number": i} for i in range(250, 400)],
-                "pagination": {"count": 400},
-            },
-        ]
-
-        call_count = 0
-
-        def make_response() -> MagicMock:
-            nonlocal call_count
-            response = MagicMock()
-            response.status_code = 200
-            response.json.return_value = responses[min(call_count, len(responses) - 1)]
-            call_count += 1
-            return response
-
-        with patch("httpx.AsyncClient") as mock_client_class:
-            mock_client = AsyncMock()
-            mock_client.get = AsyncMock(side_effect=lambda *args, **kwargs: make_response())
-            mock_client.aclose = AsyncMock()
-            mock_client_class.return_value = mock_client
-
-            async with CongressClient(config) as client:
-                result = await client.get_all("/bill/118")
-
-            assert len(result["results"]) == 400
-            assert result["count"] == 400
-            assert call_count == 2
+        # Total count 400: first page 250 items (max), second page 150 items
+        requested_offsets: list[int] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            offset = int(request.url.params["offset"])
+            requested_offsets.append(offset)
+            return httpx.Response(
+                200, json={"bills": _PAGES_400[offset], "pagination": {"count": 400}}
+            )
+
+        async with (
+            mock_http_client(config, handler) as http_client,
+            CongressClient(config, http_client=http_client) as client,
+        ):
+            result = await client.get_all("/bill/118")
+
+        assert len(result["results"]) == 400
+        assert result["count"] == 400
+        # Pages after the first may be requested in any order
+        assert sorted(requested_offsets) == [0, 250]
+
+    @pytest.mark.asyncio
+    async def test_get_all_concatenates_concurrent_pages_in_order(self, config: Config) -> None:
+        """Pages fetched concurrently are combined in offset order."""
+        requested_offsets: list[int] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            offset = int(request.url.params["offset"])
+            requested_offsets.append(offset)
+            assert request.url.params["limit"] == "250"
+            return httpx.Response(
+                200, json={"bills": _PAGES_1000[offset], "pagination": {"count": 1000}}
+            )
+
+        async with (
+            mock_http_client(config, handler) as http_client,
+            CongressClient(config, http_client=http_client) as client,
+        ):
+            result = await client.get_all("/bill/118")
+
+        assert [bill["number"] for bill in result["results"]] == list(range(1000))
+        assert sorted(requested_offsets) == [0, 250, 500, 750]
+
+    @pytest.mark.asyncio
+    async def test_iter_all_yields_items_in_order_up_to_max_results(self, config: Config) -> None:
+        """iter_all streams items in offset order and stops at max_results."""
+        requested_offsets: list[int] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            offset = int(request.url.params["offset"])
+            requested_offsets.append(offset)
+            return httpx.Response(
+                200, json={"bills": _PAGES_1000[offset], "pagination": {"count": 1000}}
+            )
+
+        async with (
+            mock_http_client(config, handler) as http_client,
+            CongressClient(config, http_client=http_client) as client,
+        ):
+            bills = client.iter_all("/bill/118", max_results=600)
+            numbers = [bill["number"] async for bill in bills]
+
+        assert numbers == list(range(600))
+        assert sorted(requested_offsets) == [0, 250, 500]
+
+    @pytest.mark.asyncio
+    async def test_iter_pages_yields_pages_in_order_up_to_max_results(self, config: Config) -> None:
+        """iter_pages yields whole pages in offset order, truncating the last one."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            offset = int(request.url.params["offset"])
+            return httpx.Response(
+                200, json={"bills": _PAGES_1000[offset], "pagination": {"count": 1000}}
+            )
+
+        async with (
+            mock_http_client(config, handler) as http_client,
+            CongressClient(config, http_client=http_client) as client,
+        ):
+            pages = [page async for page in client.iter_pages("/bill/118", max_results=600)]
+
+        assert [len(page) for page in pages] == [250, 250, 100]
+        assert [bill["number"] for page in pages for bill in page] == list(range(600))
+
+    @pytest.mark.asyncio
+    async def test_iter_all_stops_fetching_when_closed_early(self, config: Config) -> None:
+        """Closing iter_all early leaves later pages unfetched."""
+        requested_offsets: list[int] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            offset = int(request.url.params["offset"])
+            requested_offsets.append(offset)
+            return httpx.Response(
+                200, json={"bills": _PAGES_1000[offset], "pagination": {"count": 1000}}
+            )
+
+        async with (
+            mock_http_client(config, handler) as http_client,
+            CongressClient(config, http_client=http_client) as client,
+        ):
+            bills = client.iter_all("/bill/118", concurrency=1)
+            async with aclosing(bills):
+                async for bill in bills:
+                    if bill["number"] == 10:
+                        break
+
+        # The first page plus at most one page of read-ahead
+        assert set(requested_offsets) <= {0, 250}
 
     @pytest.mark.asyncio
     async def test_get_all_respects_max_results(self, config: Config) -> None:
         """Pagination stops at max_results."""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "bills": [{"number": i} for i in range(250)],
-            "pagination": {"count": 500},
-        }
 
-        with patch("httpx.AsyncClient") as mock_client_class:
-            mock_client = AsyncMock()
-            mock_client.get = AsyncMock(return_value=mock_response)
-            mock_client.aclose = AsyncMock()
-            mock_client_class.return_value = mock_client
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, json={"bills": _PAGES_1000[0], "pagination": {"count": 500}})
 
-            async with CongressClient(config) as client:
-                result = await client.get_all("/bill/118", max_results=100)
+        async with (
+            mock_http_client(config, handler) as http_client,
+            CongressClient(config, http_client=http_client) as client,
+        ):
+            result = await client.get_all("/bill/118", max_results=100)
 
-            assert len(result["results"]) == 100
-            assert result["count"] == 100
+        assert len(result["results"]) == 100
+        assert result["count"] == 100
 
     @pytest.mark.asyncio
     async def test_get_all_handles_empty_results(self, config: Config) -> None:
         """Empty results are handled correctly."""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "bills": [],
-            "pagination": {"count": 0},
-        }
 
-        with patch("httpx.AsyncClient") as mock_client_class:
-            mock_client = AsyncMock()
-            mock_client.get = AsyncMock(return_value=mock_response)
-            mock_client.aclose = AsyncMock()
-            mock_client_class.return_value = mock_client
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, json={"bills": [], "pagination": {"count": 0}})
 
-            async with CongressClient(config) as client:
-                result = await client.get_all("/bill/118")
+        async with (
+            mock_http_client(config, handler) as http_client,
+            CongressClient(config, http_client=http_client) as client,
+        ):
+            result = await client.get_all("/bill/118")
 
-            assert len(result["results"]) == 0
-            assert result["count"] == 0
+        assert len(result["results"]) == 0
+        assert result["count"] == 0
 
     @pytest.mark.asyncio
-    async def test_extract_results_various_keys(self, config: Config) -> None:
-        """Results are extracted from various API response keys."""
-        test_cases = [
+    @pytest.mark.parametrize(
+        ("key", "expected_data"),
+        [
             ("bills", [{"id": 1}]),
             ("members", [{"id": 2}]),
             ("amendments", [{"id": 3}]),
             ("committees", [{"id": 4}]),
-        ]
-
-        for key, expected_data in test_cases:
-            mock_response = MagicMock()
-            mock_response.status_code = 200
-            mock_response.json.return_value = {
-                key: expected_data,
-                "pagination": {"count": 1},
-            }
+        ],
+    )
+    async def test_extract_results_various_keys(
+        self, config: Config, key: str, expected_data: list[dict[str, Any]]
+    ) -> None:
+        """Results are extracted from various API response keys."""
 
-            with patch("httpx.AsyncClient") as mock_client_class:
-                mock_client = AsyncMock()
-                mock_client.get = AsyncMock(return_value=mock_response)
-                mock_client.aclose = AsyncMock()
-                mock_client_class.return_value = mock_client
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, json={key: expected_data, "pagination": {"count": 1}})
 
-                async with CongressClient(config) as client:
-                    result = await client.get_all("/test")
+        async with (
+            mock_http_client(config, handler) as http_client,
+            CongressClient(config, http_client=http_client) as client,
+        ):
+            result = await client.get_all("/test")
 
-                assert result["results"] == expected_data, f"Failed for key: {key}"
+        assert result["results"] == expected_data
 
     @pytest.mark.asyncio
     async def test_get_all_passes_params(self, config: Config) -> None:
         """Additional parameters are passed through to requests."""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "bills": [],
-            "pagination": {"count": 0},
-        }
-
-        with patch("httpx.AsyncClient") as mock_client_class:
-            mock_client = AsyncMock()
-            mock_client.get = AsyncMock(return_value=mock_response)
-            mock_client.aclose = AsyncMock()
-            mock_client_class.return_value = mock_client
-
-            async with CongressClient(config) as client:
-                await client.get_all(
-                    "/bill/118",
-                    params={"sort": "updateDate+desc"},
-                )
-
-            call_args = mock_client.get.call_args
-            assert call_args.kwargs["params"]["sort"] == "updateDate+desc"
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(200, json={"bills": [], "pagination": {"count": 0}})
+
+        async with (
+            mock_http_client(config, handler) as http_client,
+            CongressClient(config, http_client=http_client) as client,
+        ):
+            await client.get_all(
+                "/bill/118",
+                params={"sort": "updateDate+desc"},
+            )
+
+        assert requests[-1].url.params["sort"] == "updateDate+desc"
@@ -0,0 +1,68 @@
+"""Tests for the server entry point."""
+
+import importlib
+from types import ModuleType
+from typing import Any
+
+import pytest
+from fastmcp.client import Client
+
+
+@pytest.fixture
+def server(monkeypatch: pytest.MonkeyPatch) -> ModuleType:
+    """Import the server module, which reads its config from the environment."""
+    monkeypatch.setenv("CONGRESS_API_KEY", "test_key")
+    return importlib.import_module("congress_mcp.server")
+
+
+@pytest.mark.asyncio
+async def test_shared_http_client_survives_client_sessions(server: ModuleType) -> None:
+    """Ending one client session leaves the shared HTTP session open for the next."""
+    for _ in range(2):
+        async with Client(transport=server.mcp) as client:
+            await client.list_tools()
+        assert not server.http_client.is_closed
+
+
+@pytest.mark.asyncio
+async def test_tool_results_are_encoded_with_orjson(
+    server: ModuleType, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """With orjson installed, tool results are serialized by orjson."""
+    orjson = pytest.importorskip("orjson")
+    encoded: list[Any] = []
+    dumps = orjson.dumps
+
+    def recording_dumps(data: Any, **kwargs: Any) -> bytes:
+        encoded.append(data)
+        return dumps(data, **kwargs)
+
+    monkeypatch.setattr(orjson, "dumps", recording_dumps)
+
+    @server.mcp.tool
+    def echo_bill() -> dict[str, Any]:
+        return {"bill": {"number": 7, "title": "Café Act"}}
+
+    try:
+        async with Client(transport=server.mcp) as client:
+            result = await client.call_tool("echo_bill")
+    finally:
+        server.mcp.remove_tool("echo_bill")
+
+    assert encoded == [{"bill": {"number": 7, "title": "Café Act"}}]
+    assert result.content[0].text == '{"bill":{"number":7,"title":"Café Act"}}'
+
+
+@pytest.mark.parametrize(
+    ("data", "text"),
+    [
+        ({1: "a"}, '{"1":"a"}'),
+        ({"count": 2**70}, '{"count":1180591620717411303424}'),
+    ],
+)
+def test_serializer_falls_back_for_values_orjson_rejects(
+    server: ModuleType, data: dict[Any, Any], text: str
+) -> None:
+    """Non-str keys and ints beyond 64 bits go through FastMCP's default serializer."""
+    pytest.importorskip("orjson")
+    assert server._serialize_tool_result(data) == text
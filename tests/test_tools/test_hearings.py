@@ -4,25 +4,13 @@ These tests hit the live Congress.gov API via FastMCP's Client transport.
 Requires CONGRESS_API_KEY environment variable (set in env or .env file).
 """
 
-import json
 import os
-from pathlib import Path
 
 import pytest
-from fastmcp import FastMCP
 from fastmcp.client import Client
 
-from congress_mcp.config import Config
 from congress_mcp.tools.hearings import register_hearing_tools
-
-# Load .env file if present (same pattern as test_integration_live.py)
-_env_path = Path(__file__).parent.parent.parent / ".env"
-if _env_path.exists():
-    for line in _env_path.read_text().splitlines():
-        line = line.strip()
-        if line and not line.startswith("#") and "=" in line:
-            key, _, value = line.partition("=")
-            os.environ.setdefault(key.strip(), value.strip())
+from tests.helpers import parse_result
 
 CONGRESS = 118
 
@@ -32,44 +20,18 @@ needs_api_key = pytest.mark.skipif(
 )
 
 
-@pytest.fixture
-async def client():
-    config = Config.from_env()
-    mcp = FastMCP(name="test-hearings")
-    register_hearing_tools(mcp, config)
-    async with Client(transport=mcp) as c:
-        yield c
+TOOL_REGISTRARS = (register_hearing_tools,)
 
 
 @needs_api_key
-async def test_list_hearings_without_chamber(client: Client):
-    """list_hearings should work with only congress (no chamber)."""
-    result = await client.call_tool(
-        "list_hearings", {"congress": CONGRESS, "limit": 3}
-    )
-    data = result.data if isinstance(result.data, dict) else json.loads(result.data)
-    assert "hearings" in data
-    assert len(data["hearings"]) > 0
-
-
-@needs_api_key
-async def test_list_hearings_with_chamber(client: Client):
-    """list_hearings should still work when chamber is provided (backward compat)."""
-    result = await client.call_tool(
-        "list_hearings", {"congress": CONGRESS, "chamber": "house", "limit": 3}
-    )
-    data = result.data if isinstance(result.data, dict) else json.loads(result.data)
-    assert "hearings" in data
-    assert len(data["hearings"]) > 0
-
-
-@needs_api_key
-async def test_list_hearings_with_senate_chamber(client: Client):
-    """list_hearings should work with chamber='senate'."""
-    result = await client.call_tool(
-        "list_hearings", {"congress": CONGRESS, "chamber": "senate", "limit": 3}
-    )
-    data = result.data if isinstance(result.data, dict) else json.loads(result.data)
+@pytest.mark.parametrize("chamber", [None, "house", "senate"])
+async def test_list_hearings(client: Client, chamber: str | None):
+    """list_hearings works with only congress (no chamber) and with either chamber."""
+    args = {"congress": CONGRESS, "limit": 3}
+    if chamber:
+        args["chamber"] = chamber
+    result = await client.call_tool("list_hearings", args)
+    data = parse_result(result)
     assert "hearings" in data
     assert len(data["hearings"]) > 0
 
@@ -80,7 +42,7 @@ async def test_list_hearings_without_chamber_enriches_details(client: Client):
     result = await client.call_tool(
         "list_hearings", {"congress": CONGRESS, "limit": 2}
     )
-    data = result.data if isinstance(result.data, dict) else json.loads(result.data)
+    data = parse_result(result)
     hearings = data["hearings"]
     assert len(hearings) > 0
     first = hearings[0]
@@ -4,25 +4,19 @@ These tests hit the live Congress.gov API via FastMCP's Client transport.
 Requires CONGRESS_API_KEY environment variable (set in env or .env file).
 """
 
-import json
 import os
-from pathlib import Path
+from typing import Any
 
 import pytest
-from fastmcp import FastMCP
 from fastmcp.client import Client
 
-from congress_mcp.config import Config
-from congress_mcp.tools.summaries import _strip_html, register_summary_tools
-
-# Load .env file if present
-_env_path = Path(__file__).parent.parent.parent / ".env"
-if _env_path.exists():
-    for line in _env_path.read_text().splitlines():
-        line = line.strip()
-        if line and not line.startswith("#") and "=" in line:
-            key, _, value = line.partition("=")
-            os.environ.setdefault(key.strip(), value.strip())
+from congress_mcp.tools.summaries import (
+    _scan_page,
+    _search_text,
+    _strip_html,
+    register_summary_tools,
+)
+from tests.helpers import parse_result
 
 CONGRESS = 118
 CURRENT_CONGRESS = 119
@@ -33,68 +27,43 @@ needs_api_key = pytest.mark.skipif(
 )
 
 
-def parse_result(result) -> dict:
-    """Parse CallToolResult.data — handles both str and dict."""
-    data = result.data
-    return json.loads(data) if isinstance(data, str) else data
-
-
-@pytest.fixture
-async def client():
-    config = Config.from_env()
-    mcp = FastMCP(name="test-summaries")
-    register_summary_tools(mcp, config)
-    async with Client(transport=mcp) as c:
-        yield c
-
-
-@needs_api_key
-async def test_list_summaries_without_dates_returns_recent(client: Client):
-    """Summaries endpoint returns a small window of recent results without dates."""
-    result = await client.call_tool("list_summaries", {"limit": 1})
-    data = parse_result(result)
-    assert data["pagination"]["count"] > 0
+TOOL_REGISTRARS = (register_summary_tools,)
 
 
 @needs_api_key
-async def test_list_summaries_with_date_filter(client: Client):
-    """list_summaries returns results when date range is provided."""
-    result = await client.call_tool(
-        "list_summaries",
-        {"from_date": "2024-01-01", "to_date": "2024-12-31", "limit": 3},
-    )
-    data = parse_result(result)
-    assert data["pagination"]["count"] > 0
-    assert len(data["summaries"]) > 0
-
-
-@needs_api_key
-async def test_list_summaries_by_congress_with_date_filter(client: Client):
-    """list_summaries_by_congress returns results with date range."""
-    result = await client.call_tool(
-        "list_summaries_by_congress",
-        {"congress": CONGRESS, "from_date": "2024-01-01", "to_date": "2024-12-31", "limit": 3},
-    )
+@pytest.mark.parametrize(
+    ("tool", "args"),
+    [
+        ("list_summaries", {}),
+        ("list_summaries_by_congress", {"congress": CURRENT_CONGRESS}),
+        ("list_summaries_by_type", {"congress": CURRENT_CONGRESS, "bill_type": "hr"}),
+    ],
+)
+async def test_list_summaries_without_dates_returns_recent(
+    client: Client, tool: str, args: dict[str, Any]
+):
+    """Without date filters the API returns a small window of recent summaries."""
+    result = await client.call_tool(tool, {**args, "limit": 1})
     data = parse_result(result)
-    assert data["pagination"]["count"] > 0
     assert len(data["summaries"]) > 0
 
 
 @needs_api_key
-async def test_list_summaries_by_type_with_date_filter(client: Client):
-    """list_summaries_by_type returns results with date range."""
+@pytest.mark.parametrize(
+    ("tool", "args"),
+    [
+        ("list_summaries", {}),
+        ("list_summaries_by_congress", {"congress": CONGRESS}),
+        ("list_summaries_by_type", {"congress": CONGRESS, "bill_type": "hr"}),
+    ],
+)
+async def test_list_summaries_with_date_filter(client: Client, tool: str, args: dict[str, Any]):
+    """Summary list tools return results when a date range is provided."""
     result = await client.call_tool(
-        "list_summaries_by_type",
-        {
-            "congress": CONGRESS,
-            "bill_type": "hr",
-            "from_date": "2024-01-01",
-            "to_date": "2024-12-31",
-            "limit": 3,
-        },
+        tool,
+        {**args, "from_date": "2024-01-01", "to_date": "2024-12-31", "limit": 3},
     )
     data = parse_result(result)
-    assert data["pagination"]["count"] > 0
     assert len(data["summaries"]) > 0
 
 
@@ -106,29 +75,7 @@ async def test_list_summaries_by_congress_without_dates_past_congress(client: Cl
         {"congress": CONGRESS, "limit": 1},
     )
     data = parse_result(result)
-    assert data["pagination"]["count"] == 0
-
-
-@needs_api_key
-async def test_list_summaries_by_congress_without_dates_current_congress(client: Client):
-    """Current congress returns results without date filters."""
-    result = await client.call_tool(
-        "list_summaries_by_congress",
-        {"congress": CURRENT_CONGRESS, "limit": 1},
-    )
-    data = parse_result(result)
-    assert data["pagination"]["count"] > 0
-
-
-@needs_api_key
-async def test_list_summaries_by_type_without_dates_current_congress(client: Client):
-    """Current congress returns results by type without date filters."""
-    result = await client.call_tool(
-        "list_summaries_by_type",
-        {"congress": CURRENT_CONGRESS, "bill_type": "hr", "limit": 1},
-    )
-    data = parse_result(result)
-    assert data["pagination"]["count"] > 0
+    assert data["summaries"] == []
 
 
 @needs_api_key
@@ -144,7 +91,6 @@ async def test_list_summaries_with_sort(client: Client):
         },
     )
     data = parse_result(result)
-    assert data["pagination"]["count"] > 0
     assert len(data["summaries"]) > 0
 
 
@@ -159,10 +105,60 @@ def test_strip_html_decodes_entities():
     assert _strip_html("A &amp; B &lt; C") == "A & B < C"
 
 
+def test_strip_html_decodes_named_and_numeric_entities_once():
+    assert _strip_html("Caf&eacute;&nbsp;&#8220;Act&#8221; &amp;lt;") == "Café “Act” &lt;"
+
+
 def test_strip_html_handles_empty():
     assert _strip_html("") == ""
 
 
+def test_strip_html_returns_plain_text_unchanged():
+    assert _strip_html("No markup here > 3") == "No markup here > 3"
+
+
+def test_strip_html_normalizes_literal_nbsp_in_plain_text():
+    assert _strip_html("Health\xa0care") == "Health care"
+
+
+# --- _scan_page unit tests ---
+
+
+def test_scan_page_matches_phrases_split_by_markup():
+    page = [
+        {"text": "<p>Artificial <b>Intelligence</b> study</p>"},
+        {"text": "<p>Artificial turf</p>"},
+        {"text": "O&#39;Brien Act"},
+    ]
+    assert _scan_page(page, ("artificial intelligence",), 10) == ([page[0]], 3)
+    assert _scan_page(page, ("xyzzy", "o'brien"), 10) == ([page[2]], 3)
+    cafe = [{"text": "Caf&eacute; act"}]
+    assert _scan_page(cafe, ("café",), 10) == (cafe, 1)
+
+
+def test_scan_page_decodes_uppercase_entities_before_lowercasing():
+    page = [
+        {"text": "<p>CAF&#201; Act</p>"},
+        {"text": "<p>CAF&Eacute; Act</p>"},
+        {"text": "<p>Section &Dagger; 2</p>"},
+    ]
+    assert _scan_page(page, ("café",), 10) == (page[:2], 3)
+    assert _scan_page(page, ("‡ 2",), 10) == ([page[2]], 3)
+
+
+def test_scan_page_reuses_plain_text_across_searches():
+    page = [{"text": "<p>Tariff &amp; Trade Act</p>"}, {"text": "<p>Farm bill</p>"}]
+    _scan_page(page, ("tariff",), 10)
+    hits = _search_text.cache_info().hits
+    assert _scan_page(page, ("trade act",), 10) == ([page[0]], 2)
+    assert _search_text.cache_info().hits == hits + 1
+
+
+def test_scan_page_stops_at_max_matches():
+    page = [{"text": f"<p>Health bill {i}</p>"} for i in range(5)]
+    assert _scan_page(page, ("health",), 2) == (page[:2], 2)
+
+
 # --- search_summaries tests ---
 # Use 118th Congress with date filters and bill_type="hr" for reliable results.
 # The API only returns a small window without dates, so date filters are essential.
@@ -286,3 +282,26 @@ async def test_search_summaries_includes_bill_info(client: Client):
     assert data["match_count"] > 0
     match = data["matches"][0]
     assert "bill" in match
+
+
+@needs_api_key
+async def test_search_summaries_matches_any_of_queries(client: Client):
+    """search_summaries matches summaries containing any of the extra queries."""
+    result = await client.call_tool(
+        "search_summaries",
+        {
+            "congress": CONGRESS,
+            "query": "xyzzyplugh42",
+            "queries": ["artificial intelligence"],
+            "bill_type": "hr",
+            "from_date": "2024-01-01",
+            "to_date": "2024-12-31",
+            "max_matches": 3,
+        },
+    )
+    data = parse_result(result)
+    assert data["match_count"] > 0
+    assert data["queries"] == ["artificial intelligence"]
+    for match in data["matches"]:
+        plain = _strip_html(match.get("text", ""))
+        assert "artificial intelligence" in plain.lower()